@@ -5,25 +5,35 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
+# Python
+from collections import defaultdict
+
 # Site-Package
 from path import Path
 
 # Source.Python
 from config.cvar import _CvarManager
 from config.manager import ConfigManager
+from core import AutoUnload
+from hooks.exceptions import except_hooks
+from listeners import OnConVarChanged
 from translations.strings import LangStrings
 
 # GunGame
 from . import gg_config_logger
 from ..plugins.valid import valid_plugins
+from ..status import GunGameMatchStatus, GunGameStatus
 
 
 # =============================================================================
 # >> ALL DECLARATION
 # =============================================================================
 __all__ = (
+    'ConVarChanged',
     'GunGameConfigManager',
+    '_GunGameConVars',
     'gg_config_manager_logger',
+    'gg_convars',
 )
 
 
@@ -107,6 +117,22 @@ class _GunGameCvarManager(_CvarManager):
         )
         self.translations = translations
 
+        # Store the current values and add the instance to the dictionary
+        self.refresh()
+        gg_convars[self.name] = self
+
+    def refresh(self):
+        """Store the ConVar's current value as typed attributes.
+
+        Hot code paths should use these attributes instead of calling the
+        ConVar's get_* methods, as they are only updated when the value
+        of the ConVar changes.
+        """
+        self.string_value = self.get_string()
+        self.int_value = self.get_int()
+        self.float_value = self.get_float()
+        self.bool_value = self.get_bool()
+
     def add_text(self, **tokens):
         """Add all other text for the ConVar."""
         if self._base_item is None:
@@ -126,3 +152,78 @@ class _GunGameCvarManager(_CvarManager):
             getattr(self, attribute).append(
                 self.translations[item].get_string(**tokens)
             )
+
+
+class _GunGameConVars(dict):
+    """Dictionary used to store GunGame ConVars and their change callbacks."""
+
+    def __init__(self):
+        """Create the dictionary to store callbacks by ConVar name."""
+        super().__init__()
+        self._callbacks = defaultdict(list)
+
+    def register_callback(self, name, callback):
+        """Register the callback to be called when the ConVar changes."""
+        if callback in self._callbacks[name]:
+            raise ValueError('Callback already registered.')
+        self._callbacks[name].append(callback)
+
+    def unregister_callback(self, name, callback):
+        """Unregister the callback from the ConVar."""
+        if callback not in self._callbacks.get(name, ()):
+            raise ValueError('Callback is not registered.')
+        self._callbacks[name].remove(callback)
+        if not self._callbacks[name]:
+            del self._callbacks[name]
+
+    def value_changed(self, name):
+        """Refresh the ConVar's stored values and call its callbacks."""
+        if name not in self:
+            return
+        convar = self[name]
+        convar.refresh()
+        if GunGameStatus.MATCH is GunGameMatchStatus.UNLOADING:
+            return
+        for callback in list(self._callbacks.get(name, ())):
+            try:
+                callback(convar)
+            except Exception:
+                except_hooks.print_exception()
+
+    def refresh_all(self):
+        """Refresh the stored values of all ConVars."""
+        for convar in self.values():
+            convar.refresh()
+
+# The singleton object of the _GunGameConVars class.
+gg_convars = _GunGameConVars()
+
+
+class ConVarChanged(AutoUnload):
+    """Decorator class used to register GunGame ConVar change callbacks."""
+
+    def __init__(self, *convars):
+        """Store the ConVar names."""
+        self.names = [getattr(convar, 'name', convar) for convar in convars]
+        self.callback = None
+
+    def __call__(self, callback):
+        """Store the callback and register it to all of the ConVars."""
+        self.callback = callback
+        for name in self.names:
+            gg_convars.register_callback(name, self.callback)
+        return callback
+
+    def _unload_instance(self):
+        """Unregister the callback from all of the ConVars."""
+        for name in self.names:
+            gg_convars.unregister_callback(name, self.callback)
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnConVarChanged
+def _convar_changed(convar, old_value):
+    """Refresh the stored values of GunGame ConVars when they change."""
+    gg_convars.value_changed(convar.name)
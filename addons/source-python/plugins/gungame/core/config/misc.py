@@ -14,12 +14,22 @@ from .manager import GunGameConfigManager
 # =============================================================================
 __all__ = (
     'allow_kills_after_round',
+    'always_fire_events',
     'cancel_on_fire',
+    'coalesce_leaders',
+    'cosmetic_max_age',
+    'cosmetic_time_budget',
     'dynamic_chat_time',
+    'entity_budget_plugin_limit',
+    'entity_budget_reserve',
     'give_armor',
     'give_defusers',
     'level_on_protect',
+    'load_governor_budget',
     'map_strip_exceptions',
+    'plugin_breaker_action',
+    'plugin_strike_limit',
+    'plugin_time_limit',
     'prune_database',
     'sound_pack',
     'spawn_protection',
@@ -47,6 +57,48 @@ with GunGameConfigManager('misc') as _config:
     with _config.cvar('spawn_protect_can_level_up') as level_on_protect:
         level_on_protect.add_text()
 
+    with _config.cvar('coalesce_leader_changes') as coalesce_leaders:
+        coalesce_leaders.add_text()
+
+    with _config.cvar('always_fire_events') as always_fire_events:
+        always_fire_events.add_text()
+
+    with _config.cvar(
+        'cosmetic_time_budget', 2, min_value=0,
+    ) as cosmetic_time_budget:
+        cosmetic_time_budget.add_text()
+
+    with _config.cvar('cosmetic_max_age', 2, min_value=0) as cosmetic_max_age:
+        cosmetic_max_age.add_text()
+
+    with _config.cvar(
+        'load_governor_budget', 0, min_value=0,
+    ) as load_governor_budget:
+        load_governor_budget.add_text()
+
+    with _config.cvar('plugin_breaker_action', 1) as plugin_breaker_action:
+        plugin_breaker_action.add_text()
+
+    with _config.cvar(
+        'plugin_time_limit', 5, min_value=0,
+    ) as plugin_time_limit:
+        plugin_time_limit.add_text()
+
+    with _config.cvar(
+        'plugin_strike_limit', 5, min_value=1,
+    ) as plugin_strike_limit:
+        plugin_strike_limit.add_text()
+
+    with _config.cvar(
+        'entity_budget_reserve', 100, min_value=0,
+    ) as entity_budget_reserve:
+        entity_budget_reserve.add_text()
+
+    with _config.cvar(
+        'entity_budget_plugin_limit', 64, min_value=0,
+    ) as entity_budget_plugin_limit:
+        entity_budget_plugin_limit.add_text()
+
     with _config.cvar('give_armor') as give_armor:
         give_armor.add_text()
 
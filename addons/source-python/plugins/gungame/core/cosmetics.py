@@ -0,0 +1,133 @@
+# ../gungame/core/cosmetics.py
+
+"""Deferred cosmetic effect functionality."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from enum import IntEnum
+from heapq import heappop, heappush
+from itertools import count
+from time import perf_counter
+
+# Source.Python
+from hooks.exceptions import except_hooks
+from listeners import OnLevelShutdown, on_tick_listener_manager
+
+# GunGame
+from .config.misc import cosmetic_max_age, cosmetic_time_budget
+from .governor import load_governor
+from .players.roster import player_roster
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'CosmeticPriority',
+    '_CosmeticQueue',
+    'cosmetic_queue',
+)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class CosmeticPriority(IntEnum):
+    """Cosmetic effect priority values, lowest values are run first."""
+
+    # Information the player needs, like level info hints
+    HIGH = 0
+
+    # Chat messages and sounds
+    NORMAL = 1
+
+    # Purely visual effects, like sparks and dissolves
+    LOW = 2
+
+
+class _CosmeticQueue(list):
+    """Priority queue of cosmetic effects run after the tick's gameplay.
+
+    Each tick, effects are run in priority order until the time budget is
+    used up, and any effect that has waited longer than the maximum age is
+    dropped instead of being run late.
+    """
+
+    def __init__(self):
+        """Store the counter used to keep same priority effects in order."""
+        super().__init__()
+        self._counter = count()
+        self._registered = False
+        self.dropped = 0
+
+    def add(
+        self, callback, *args, priority=CosmeticPriority.NORMAL, userid=None,
+        **kwargs
+    ):
+        """Add the effect to be run on a later tick.
+
+        If a userid is given, the effect is dropped if that player
+        disconnects before it is run.
+        """
+        if not self._registered:
+            on_tick_listener_manager.register_listener(self._tick)
+            self._registered = True
+        heappush(
+            self,
+            (
+                priority, next(self._counter), perf_counter(), userid,
+                callback, args, kwargs,
+            )
+        )
+
+    def clear(self):
+        """Remove all effects without running them."""
+        super().clear()
+        self._unregister()
+
+    def _unregister(self):
+        """Stop running on ticks since there are no effects."""
+        if self._registered:
+            on_tick_listener_manager.unregister_listener(self._tick)
+            self._registered = False
+
+    def _tick(self):
+        """Run effects until the time budget is used up."""
+        with load_governor:
+            self._run_effects()
+        if not self:
+            self._unregister()
+
+    def _run_effects(self):
+        """Run effects in priority order while there is time left."""
+        start = perf_counter()
+        end_time = start + cosmetic_time_budget.float_value / 1000
+        max_age = cosmetic_max_age.float_value
+        while self:
+            effect = heappop(self)
+            added, userid, callback, args, kwargs = effect[2:]
+            if max_age > 0 and start - added > max_age:
+                self.dropped += 1
+                continue
+            if userid is not None and userid not in player_roster:
+                continue
+            try:
+                callback(*args, **kwargs)
+            except Exception:
+                except_hooks.print_exception()
+            if perf_counter() >= end_time:
+                break
+
+# The singleton object of the _CosmeticQueue class.
+cosmetic_queue = _CosmeticQueue()
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    """Clear the queued effects on map change."""
+    cosmetic_queue.clear()
@@ -0,0 +1,242 @@
+# ../gungame/core/entity_budget.py
+
+"""Counting, capping, and reuse of GunGame created entities."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from collections import Counter, defaultdict
+
+# Source.Python
+from engines.server import engine_server, global_vars
+from entities.entity import Entity
+from entities.helpers import index_from_inthandle
+from listeners import OnEntityDeleted, OnLevelShutdown
+
+# GunGame
+from .config.misc import entity_budget_plugin_limit, entity_budget_reserve
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    '_EntityBudget',
+    'entity_budget',
+)
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# The owner used for entities created by GunGame itself
+_CORE_OWNER = 'gungame'
+
+# The maximum number of released entities to keep for each classname
+_MAX_POOLED = 8
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _EntityBudget(object):
+    """Class used to keep track of the entities GunGame and plugins create.
+
+    Cosmetic entities are created through create, which refuses to create
+    them when the owner is over its limit or the server is running out of
+    edicts, and reuses released entities of the same classname.  Shared
+    helper entities are created once per map through get_helper.  They
+    are listed separately and never count toward an owner's limit, since
+    they must exist.
+    """
+
+    def __init__(self):
+        """Create the dictionaries used to store the entities."""
+        self.usage = defaultdict(Counter)
+        self.created = Counter()
+        self.reused = Counter()
+        self.denied = Counter()
+        self._entities = dict()
+        self._helpers = dict()
+        self._helper_owners = dict()
+        self._pools = defaultdict(list)
+
+    @staticmethod
+    def get_free_edicts():
+        """Return the number of free edicts on the server."""
+        return global_vars.max_entities - engine_server.get_entity_count()
+
+    def can_create(self, owner=_CORE_OWNER):
+        """Return whether the owner is allowed to create another entity."""
+        return self.is_within_limit(owner) and self.has_free_edicts()
+
+    def is_within_limit(self, owner=_CORE_OWNER):
+        """Return whether the owner is below its entity limit."""
+        limit = entity_budget_plugin_limit.int_value
+        if not limit or owner not in self.usage:
+            return True
+        return sum(self.usage[owner].values()) < limit
+
+    def has_free_edicts(self):
+        """Return whether more edicts than the reserve are free."""
+        reserve = entity_budget_reserve.int_value
+        return not reserve or self.get_free_edicts() > reserve
+
+    def create(self, class_name, owner=_CORE_OWNER):
+        """Return an entity for the owner (None if over the budget).
+
+        Released entities are reused even when the edict reserve is
+        reached, since they do not use another edict.
+        """
+        if not self.is_within_limit(owner):
+            self.denied[owner] += 1
+            return None
+        entity = self._get_pooled(class_name)
+        if entity is not None:
+            self.reused[owner] += 1
+        elif not self.has_free_edicts():
+            self.denied[owner] += 1
+            return None
+        else:
+            entity = Entity.create(class_name)
+            self.created[owner] += 1
+        self.track(entity, owner)
+        return entity
+
+    def release(self, entity):
+        """Keep the entity to be reused if there is room, or remove it."""
+        self._untrack(entity.index)
+        pool = self._pools[entity.classname]
+        if len(pool) >= _MAX_POOLED:
+            entity.remove()
+            return
+        pool.append(entity.inthandle)
+
+    def get_helper(self, class_name, owner=_CORE_OWNER):
+        """Return the map's shared entity of the given classname."""
+        entity = self._get_valid(self._helpers.get(class_name))
+        if entity is not None:
+            return entity
+        entity = Entity.find_or_create(class_name)
+        self._helpers[class_name] = entity.inthandle
+        self._helper_owners[class_name] = owner
+        return entity
+
+    def track(self, entity, owner=_CORE_OWNER):
+        """Count the entity as one of the owner's entities."""
+        index = entity.index
+        self._untrack(index)
+        class_name = entity.classname
+        self._entities[index] = (owner, class_name)
+        self.usage[owner][class_name] += 1
+
+    def entity_deleted(self, index):
+        """Stop counting the entity since it was removed."""
+        self._untrack(index)
+
+    def clear(self):
+        """Remove all stored entities."""
+        self.usage.clear()
+        self._entities.clear()
+        self._helpers.clear()
+        self._helper_owners.clear()
+        self._pools.clear()
+
+    def get_usage_lines(self):
+        """Return lines describing the current entity usage."""
+        lines = [
+            'Free edicts: {free} (reserve {reserve})'.format(
+                free=self.get_free_edicts(),
+                reserve=entity_budget_reserve.int_value,
+            ),
+        ]
+        for owner in sorted(set(self.usage) | set(self.denied)):
+            lines.append(
+                '{owner}: {count} entities, {created} created, '
+                '{reused} reused, {denied} denied'.format(
+                    owner=owner,
+                    count=sum(self.usage[owner].values()),
+                    created=self.created[owner],
+                    reused=self.reused[owner],
+                    denied=self.denied[owner],
+                )
+            )
+            for class_name, count in sorted(self.usage[owner].items()):
+                lines.append(
+                    '\t{class_name}: {count}'.format(
+                        class_name=class_name,
+                        count=count,
+                    )
+                )
+        for class_name, owner in sorted(self._helper_owners.items()):
+            if self._get_valid(self._helpers[class_name]) is not None:
+                lines.append(
+                    'Helper {class_name}: {owner}'.format(
+                        class_name=class_name,
+                        owner=owner,
+                    )
+                )
+        for class_name, pool in sorted(self._pools.items()):
+            if pool:
+                lines.append(
+                    'Pooled {class_name}: {count}'.format(
+                        class_name=class_name,
+                        count=len(pool),
+                    )
+                )
+        return lines
+
+    def _get_pooled(self, class_name):
+        """Return a valid released entity of the classname, if any."""
+        pool = self._pools.get(class_name)
+        while pool:
+            entity = self._get_valid(pool.pop())
+            if entity is not None:
+                return entity
+        return None
+
+    @staticmethod
+    def _get_valid(inthandle):
+        """Return the entity of the inthandle if it is still valid."""
+        if inthandle is None:
+            return None
+        try:
+            return Entity(index_from_inthandle(inthandle))
+        except (OverflowError, ValueError):
+            return None
+
+    def _untrack(self, index):
+        """Remove the entity from its owner's usage."""
+        value = self._entities.pop(index, None)
+        if value is None:
+            return
+        owner, class_name = value
+        usage = self.usage[owner]
+        usage[class_name] -= 1
+        if usage[class_name] <= 0:
+            del usage[class_name]
+        if not usage:
+            del self.usage[owner]
+
+# The singleton object of the _EntityBudget class.
+entity_budget = _EntityBudget()
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnEntityDeleted
+def _entity_deleted(base_entity):
+    """Stop counting the entity if it was tracked."""
+    try:
+        index = base_entity.index
+    except ValueError:
+        return
+    entity_budget.entity_deleted(index)
+
+
+@OnLevelShutdown
+def _level_shutdown():
+    """Clear the stored entities on map change."""
+    entity_budget.clear()
@@ -0,0 +1,124 @@
+# ../gungame/core/entity_index.py
+
+"""Per-map index of entities by classname."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from collections import defaultdict
+
+# Source.Python
+from entities.entity import Entity
+from filters.entities import EntityIter
+from listeners import OnEntityCreated, OnEntityDeleted, OnLevelInit
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    '_EntityIndex',
+    'entity_index',
+)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _EntityIndex(defaultdict):
+    """Dictionary of entity index sets by classname.
+
+    Only tracked classnames are stored.  The sets are built from the
+    entity list when a map starts or a classname is first tracked, and
+    are kept current from entity created and deleted listeners.
+    """
+
+    def __init__(self, *class_names):
+        """Track the given classnames."""
+        super().__init__(set)
+        self._refcounts = defaultdict(int)
+        for class_name in class_names:
+            self.track(class_name)
+
+    def track(self, class_name):
+        """Start storing the indexes of the given classname."""
+        self._refcounts[class_name] += 1
+        if self._refcounts[class_name] == 1:
+            self.rebuild(class_name)
+
+    def untrack(self, class_name):
+        """Stop storing the classname once no one is tracking it."""
+        self._refcounts[class_name] -= 1
+        if self._refcounts[class_name] > 0:
+            return
+        del self._refcounts[class_name]
+        self.pop(class_name, None)
+
+    def is_tracked(self, class_name):
+        """Return whether the classname is being tracked."""
+        return class_name in self._refcounts
+
+    def rebuild(self, class_name=None):
+        """Build the index sets from the entity list."""
+        class_names = (
+            self._refcounts if class_name is None else (class_name, )
+        )
+        for name in class_names:
+            self[name] = {entity.index for entity in EntityIter(name)}
+
+    def iter_entities(self, class_name):
+        """Yield an Entity instance for each index of the classname."""
+        for index in tuple(self.get(class_name, ())):
+            yield Entity(index)
+
+    def add_entity(self, class_name, index):
+        """Add the index if its classname is tracked."""
+        if class_name in self._refcounts:
+            self[class_name].add(index)
+
+    def remove_entity(self, class_name, index):
+        """Remove the index if its classname is tracked."""
+        if class_name in self._refcounts:
+            self[class_name].discard(index)
+
+# The singleton object of the _EntityIndex class.
+entity_index = _EntityIndex(
+    'func_bomb_target', 'func_buyzone', 'func_hostage_rescue',
+    'hostage_entity', 'weapon_c4',
+)
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelInit
+def _level_init(map_name):
+    """Build the index for the new map."""
+    entity_index.rebuild()
+
+
+@OnEntityCreated
+def _entity_created(base_entity):
+    """Add the entity if its classname is tracked."""
+    class_name = base_entity.classname
+    if not entity_index.is_tracked(class_name):
+        return
+    try:
+        index = base_entity.index
+    except ValueError:
+        return
+    entity_index.add_entity(class_name, index)
+
+
+@OnEntityDeleted
+def _entity_deleted(base_entity):
+    """Remove the entity if its classname is tracked."""
+    class_name = base_entity.classname
+    if not entity_index.is_tracked(class_name):
+        return
+    try:
+        index = base_entity.index
+    except ValueError:
+        return
+    entity_index.remove_entity(class_name, index)
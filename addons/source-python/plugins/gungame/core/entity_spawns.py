@@ -0,0 +1,105 @@
+# ../gungame/core/entity_spawns.py
+
+"""Entity spawned callbacks filtered by classname."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from collections import defaultdict
+
+# Source.Python
+from core import AutoUnload
+from hooks.exceptions import except_hooks
+from listeners import on_entity_spawned_listener_manager
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'OnClassSpawned',
+    '_ClassSpawnedManager',
+    'class_spawned_manager',
+)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _ClassSpawnedManager(defaultdict):
+    """Dictionary of entity spawned callbacks by classname.
+
+    A single entity spawned listener compares the classname of the base
+    entity with the stored classnames, so no Entity instance is created
+    for other entities.  The listener is only registered while there are
+    callbacks.
+    """
+
+    def __init__(self):
+        """Store the base values."""
+        super().__init__(list)
+        self._registered = False
+
+    def register_callback(self, class_name, callback):
+        """Call the callback when an entity of the classname spawns."""
+        callbacks = self[class_name]
+        if callback in callbacks:
+            return
+        callbacks.append(callback)
+        if not self._registered:
+            on_entity_spawned_listener_manager.register_listener(
+                self._entity_spawned,
+            )
+            self._registered = True
+
+    def unregister_callback(self, class_name, callback):
+        """Stop calling the callback for the classname."""
+        callbacks = self.get(class_name)
+        if callbacks is None or callback not in callbacks:
+            return
+        callbacks.remove(callback)
+        if not callbacks:
+            del self[class_name]
+        if not self and self._registered:
+            on_entity_spawned_listener_manager.unregister_listener(
+                self._entity_spawned,
+            )
+            self._registered = False
+
+    def _entity_spawned(self, base_entity):
+        """Call the callbacks registered for the entity's classname."""
+        callbacks = self.get(base_entity.classname)
+        if not callbacks:
+            return
+        for callback in tuple(callbacks):
+            try:
+                callback(base_entity)
+            except Exception:
+                except_hooks.print_exception()
+
+# The singleton object of the _ClassSpawnedManager class.
+class_spawned_manager = _ClassSpawnedManager()
+
+
+class OnClassSpawned(AutoUnload):
+    """Decorator class used to register classname spawned callbacks."""
+
+    def __init__(self, *class_names):
+        """Store the classnames."""
+        self.class_names = class_names
+        self.callback = None
+
+    def __call__(self, callback):
+        """Store the callback and register it to all of the classnames."""
+        self.callback = callback
+        for class_name in self.class_names:
+            class_spawned_manager.register_callback(class_name, callback)
+        return callback
+
+    def _unload_instance(self):
+        """Unregister the callback from all of the classnames."""
+        for class_name in self.class_names:
+            class_spawned_manager.unregister_callback(
+                class_name, self.callback,
+            )
@@ -0,0 +1,191 @@
+# ../gungame/core/events/bus.py
+
+"""In-process delivery of GunGame custom events."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from collections import defaultdict
+
+# Source.Python
+from core import AutoUnload
+from events.custom import CustomEvent
+from events.hooks import EventAction, pre_event_manager
+from events.manager import event_manager
+from hooks.exceptions import except_hooks
+
+# GunGame
+from ..config.misc import always_fire_events
+from ..governor import load_governor
+from ..plugins.breaker import plugin_breaker
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'GGEvent',
+    'GGPreEvent',
+    'GunGameEvent',
+    '_GGEventBus',
+    '_GunGameEventMixin',
+    'gg_event_bus',
+)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _GGEventBus(object):
+    """Class used to deliver GunGame events to GunGame listeners."""
+
+    def __init__(self):
+        """Create the dictionaries to store the callbacks by event name."""
+        self.listeners = defaultdict(list)
+        self.pre_listeners = defaultdict(list)
+
+    @staticmethod
+    def _register(callbacks, event_name, callback):
+        """Add the callback to the event's callbacks."""
+        if not callable(callback):
+            raise ValueError('Callback is not callable.')
+        if callback in callbacks[event_name]:
+            raise ValueError('Callback already registered.')
+        callbacks[event_name].append(plugin_breaker.guard(callback))
+
+    @staticmethod
+    def _unregister(callbacks, event_name, callback):
+        """Remove the callback from the event's callbacks."""
+        if callback not in callbacks.get(event_name, ()):
+            raise ValueError('Callback is not registered.')
+        callbacks[event_name].remove(callback)
+        if not callbacks[event_name]:
+            del callbacks[event_name]
+
+    def register_for_event(self, event_name, callback):
+        """Register the callback for the given event."""
+        self._register(self.listeners, event_name, callback)
+
+    def unregister_for_event(self, event_name, callback):
+        """Unregister the callback from the given event."""
+        self._unregister(self.listeners, event_name, callback)
+
+    def register_for_pre_event(self, event_name, callback):
+        """Register the pre-event callback for the given event."""
+        self._register(self.pre_listeners, event_name, callback)
+
+    def unregister_for_pre_event(self, event_name, callback):
+        """Unregister the pre-event callback from the given event."""
+        self._unregister(self.pre_listeners, event_name, callback)
+
+    def call_pre_listeners(self, event):
+        """Return whether any pre-event callback blocked the event."""
+        blocked = False
+        for callback in list(self.pre_listeners.get(event.name, ())):
+            try:
+                if callback(event) == EventAction.BLOCK:
+                    blocked = True
+            except Exception:
+                except_hooks.print_exception()
+        return blocked
+
+    def call_listeners(self, event):
+        """Call all callbacks registered for the event."""
+        for callback in list(self.listeners.get(event.name, ())):
+            try:
+                callback(event)
+            except Exception:
+                except_hooks.print_exception()
+
+    @staticmethod
+    def has_external_listeners(event_name):
+        """Return whether the event needs to be fired by the engine."""
+        return (
+            always_fire_events.bool_value or
+            event_name in event_manager or
+            event_name in pre_event_manager
+        )
+
+# The singleton object of the _GGEventBus class.
+gg_event_bus = _GGEventBus()
+
+
+class _GunGameEventMixin(object):
+    """Methods of GunGame custom events.
+
+    The methods are kept outside of GunGameEvent, since the CustomEvent
+    metaclass stores every attribute defined in an event's class body as
+    an event variable.
+    """
+
+    def __init__(self, **kwargs):
+        """Set the default values before the given ones."""
+        self.reset()
+        super().__init__(**kwargs)
+
+    def __getitem__(self, variable):
+        """Return the value of the given event variable."""
+        if variable not in self._odict:
+            raise KeyError(
+                'Event "{event}" has no variable "{variable}".'.format(
+                    event=self.name,
+                    variable=variable,
+                )
+            )
+        return getattr(self, '_' + variable)
+
+    def fire(self):
+        """Deliver the event to GunGame and, if needed, engine listeners."""
+        with load_governor:
+            if gg_event_bus.call_pre_listeners(self):
+                return
+            gg_event_bus.call_listeners(self)
+        if gg_event_bus.has_external_listeners(self.name):
+            super().fire()
+
+
+class GunGameEvent(_GunGameEventMixin, CustomEvent):
+    """Base class for GunGame custom events.
+
+    Firing the event delivers the instance itself to the GunGame listeners
+    registered with GGEvent.  The engine event is only created and fired
+    when another plugin is listening to it.
+    """
+
+
+class GGEvent(AutoUnload):
+    """Decorator class used to register GunGame event listeners."""
+
+    def __init__(self, *event_names):
+        """Store the event names."""
+        self.event_names = event_names
+        self.callback = None
+
+    def __call__(self, callback):
+        """Store the callback and register it for the events."""
+        self.callback = callback
+        for event_name in self.event_names:
+            gg_event_bus.register_for_event(event_name, self.callback)
+        return callback
+
+    def _unload_instance(self):
+        """Unregister the callback from the events."""
+        for event_name in self.event_names:
+            gg_event_bus.unregister_for_event(event_name, self.callback)
+
+
+class GGPreEvent(GGEvent):
+    """Decorator class used to register GunGame pre-event listeners."""
+
+    def __call__(self, callback):
+        """Store the callback and register it for the events."""
+        self.callback = callback
+        for event_name in self.event_names:
+            gg_event_bus.register_for_pre_event(event_name, self.callback)
+        return callback
+
+    def _unload_instance(self):
+        """Unregister the callback from the events."""
+        for event_name in self.event_names:
+            gg_event_bus.unregister_for_pre_event(event_name, self.callback)
@@ -0,0 +1,84 @@
+# ../gungame/core/events/conditional.py
+
+"""Event registration that depends on ConVar values or conditions."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python
+from core import AutoUnload
+from events.manager import event_manager
+
+# GunGame
+from ..config.manager import gg_convars
+from ..plugins.breaker import plugin_breaker
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'ConditionalEvent',
+)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class ConditionalEvent(AutoUnload):
+    """Decorator class used to register events only while they are needed.
+
+    Without a condition, the callback is registered while all of the given
+    ConVars are enabled.  With a condition, the callback is registered
+    while the condition returns True, and it is checked again any time one
+    of the given ConVars changes or update is called.
+    """
+
+    def __init__(self, *event_names, convars=(), condition=None):
+        """Store the events, ConVars, and condition."""
+        self.event_names = event_names
+        self.convars = tuple(convars)
+        self.condition = condition
+        self.callback = None
+        self.registered = False
+
+    def __call__(self, callback):
+        """Store the callback and register it if it is needed."""
+        self.callback = plugin_breaker.guard(callback, can_disable=True)
+        for convar in self.convars:
+            gg_convars.register_callback(convar.name, self._convar_changed)
+        self.update()
+        return callback
+
+    @property
+    def is_needed(self):
+        """Return whether the callback should be registered."""
+        if self.condition is not None:
+            return bool(self.condition())
+        return all(convar.bool_value for convar in self.convars)
+
+    def update(self):
+        """Register or unregister the callback for the current state."""
+        needed = self.is_needed
+        if needed == self.registered:
+            return
+        for event_name in self.event_names:
+            if needed:
+                event_manager.register_for_event(event_name, self.callback)
+            else:
+                event_manager.unregister_for_event(event_name, self.callback)
+        self.registered = needed
+
+    def _convar_changed(self, convar):
+        """Check the condition again since one of the ConVars changed."""
+        self.update()
+
+    def _unload_instance(self):
+        """Unregister the callback and the ConVar callbacks."""
+        for convar in self.convars:
+            gg_convars.unregister_callback(convar.name, self._convar_changed)
+        if not self.registered:
+            return
+        for event_name in self.event_names:
+            event_manager.unregister_for_event(event_name, self.callback)
+        self.registered = False
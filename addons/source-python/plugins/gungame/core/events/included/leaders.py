@@ -6,10 +6,10 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events.custom import CustomEvent
 from events.variable import ByteVariable, ShortVariable, StringVariable
 
 # GunGame
+from ..bus import GunGameEvent
 from ..resource import GGResourceFile
 
 
@@ -27,7 +27,7 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class GG_New_Leader(CustomEvent):
+class GG_New_Leader(GunGameEvent):
     """Called when a player becomes the new leader."""
 
     userid = leveler = ShortVariable(
@@ -43,7 +43,7 @@ class GG_New_Leader(CustomEvent):
     leader_level = ByteVariable("The current leader's level")
 
 
-class GG_Tied_Leader(CustomEvent):
+class GG_Tied_Leader(GunGameEvent):
     """Called when a player ties the leader."""
 
     userid = leveler = ShortVariable(
@@ -58,7 +58,7 @@ class GG_Tied_Leader(CustomEvent):
     leader_level = ByteVariable("The current leader's level")
 
 
-class GG_Leader_Lost_Level(CustomEvent):
+class GG_Leader_Lost_Level(GunGameEvent):
     """Called when the leader loses a level."""
 
     userid = leveler = ShortVariable(
@@ -74,7 +74,7 @@ class GG_Leader_Lost_Level(CustomEvent):
     leader_level = ByteVariable("The current leader's level")
 
 
-class GG_Leader_Disconnect(CustomEvent):
+class GG_Leader_Disconnect(GunGameEvent):
     """Called when the leader disconnects from the server."""
 
     userid = ShortVariable('The userid of the leader that disconnected')
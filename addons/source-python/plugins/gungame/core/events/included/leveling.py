@@ -6,10 +6,10 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events.custom import CustomEvent
 from events.variable import ByteVariable, ShortVariable, StringVariable
 
 # GunGame
+from ..bus import GunGameEvent
 from ..resource import GGResourceFile
 
 
@@ -25,7 +25,7 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class GG_Level_Up(CustomEvent):
+class GG_Level_Up(GunGameEvent):
     """Called when a player levels up."""
 
     attacker = leveler = ShortVariable(
@@ -39,7 +39,7 @@ class GG_Level_Up(CustomEvent):
     reason = StringVariable('The reason for the level-up')
 
 
-class GG_Level_Down(CustomEvent):
+class GG_Level_Down(GunGameEvent):
     """Called when a player loses a level."""
 
     userid = leveler = ShortVariable(
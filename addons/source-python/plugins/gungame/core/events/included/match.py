@@ -6,10 +6,10 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events.custom import CustomEvent
 from events.variable import ShortVariable
 
 # GunGame
+from ..bus import GunGameEvent
 from ..resource import GGResourceFile
 
 
@@ -28,7 +28,7 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class GG_Win(CustomEvent):
+class GG_Win(GunGameEvent):
     """Called when a player wins the match."""
 
     attacker = winner = ShortVariable(
@@ -39,19 +39,19 @@ class GG_Win(CustomEvent):
     )
 
 
-class GG_Start(CustomEvent):
+class GG_Start(GunGameEvent):
     """Called when a new match begins."""
 
 
-class GG_Map_End(CustomEvent):
+class GG_Map_End(GunGameEvent):
     """Called when no winner is declared but the map ends."""
 
 
-class GG_Load(CustomEvent):
+class GG_Load(GunGameEvent):
     """Called when GunGame finishes loading."""
 
 
-class GG_Unload(CustomEvent):
+class GG_Unload(GunGameEvent):
     """Called when GunGame is unloading."""
 
 # =============================================================================
@@ -6,10 +6,10 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events.custom import CustomEvent
 from events.variable import StringVariable
 
 # GunGame
+from ..bus import GunGameEvent
 from ..resource import GGResourceFile
 
 
@@ -25,14 +25,14 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class GG_Plugin_Loaded(CustomEvent):
+class GG_Plugin_Loaded(GunGameEvent):
     """Called when a GunGame sub-plugin is loaded."""
 
     plugin = StringVariable('The name of the plugin that was loaded')
     plugin_type = StringVariable('The type of plugin that was loaded')
 
 
-class GG_Plugin_Unloaded(CustomEvent):
+class GG_Plugin_Unloaded(GunGameEvent):
     """Called when a GunGame sub-plugin is unloaded."""
 
     plugin = StringVariable('The name of the plugin that was unloaded')
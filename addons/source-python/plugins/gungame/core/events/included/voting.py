@@ -6,10 +6,10 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events.custom import CustomEvent
 from events.variable import ShortVariable, StringVariable
 
 # GunGame
+from ..bus import GunGameEvent
 from ..resource import GGResourceFile
 
 
@@ -27,26 +27,26 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class GG_Vote_Start(CustomEvent):
+class GG_Vote_Start(GunGameEvent):
     """Called when a vote has started."""
 
     vote_type = StringVariable('The type of vote')
 
 
-class GG_Vote_End(CustomEvent):
+class GG_Vote_End(GunGameEvent):
     """Called when a vote ends."""
 
     winner = StringVariable('The winning choice')
 
 
-class GG_Vote_Submit(CustomEvent):
+class GG_Vote_Submit(GunGameEvent):
     """Called each time a vote is submitted."""
 
     userid = voter = ShortVariable('The userid of the player that voted')
     choice = StringVariable('The choice submitted by the player')
 
 
-class GG_Vote_Canceled(CustomEvent):
+class GG_Vote_Canceled(GunGameEvent):
     """Called when a vote ends by being canceled."""
 
     reason = StringVariable('The reason the vote was canceled')
@@ -0,0 +1,215 @@
+# ../gungame/core/governor.py
+
+"""Load-shedding of cosmetic features while the server is under load."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from enum import IntEnum
+from time import perf_counter
+
+# Source.Python
+from engines.server import global_vars
+from listeners import on_tick_listener_manager
+
+# GunGame
+from . import gg_core_logger
+from .config.manager import ConVarChanged
+from .config.misc import load_governor_budget
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'LoadLevel',
+    '_LoadGovernor',
+    'gg_governor_logger',
+    'load_governor',
+)
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+gg_governor_logger = gg_core_logger.governor
+
+# The number of calm windows in a row needed to step back down
+_RECOVER_WINDOWS = 3
+
+# The minimum number of seconds between hints to a player when throttled
+_HINT_INTERVAL = 1
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class LoadLevel(IntEnum):
+    """Degradation levels, each including the ones below it."""
+
+    # All features are enabled
+    NORMAL = 0
+
+    # Send each player at most one hint message per interval
+    THROTTLE_HINTS = 1
+
+    # Skip ragdoll dissolves and sparks
+    SKIP_EFFECTS = 2
+
+    # Drop non-essential sounds
+    DROP_SOUNDS = 3
+
+
+class _LoadGovernor(object):
+    """Class used to step through degradation levels based on load.
+
+    GunGame's own time is measured by using the instance as a context
+    manager around GunGame work.  Once a second, the average time per tick
+    of that work is compared to the budget, so slow ticks caused by the
+    game or other plugins do not change the level.
+    """
+
+    def __init__(self):
+        """Store the base values."""
+        self.level = LoadLevel.NORMAL
+        self._depth = 0
+        self._start = 0
+        self._registered = False
+        self._hint_times = dict()
+        self._calm_windows = 0
+        self._reset_window()
+
+    def __enter__(self):
+        """Start timing GunGame work."""
+        if not self._depth:
+            self._start = perf_counter()
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, trace_back):
+        """Add the GunGame work's time to the current window."""
+        self._depth -= 1
+        if not self._depth:
+            self._window_time += perf_counter() - self._start
+        return False
+
+    @property
+    def throttle_hints(self):
+        """Return whether hint messages are throttled."""
+        return self.level >= LoadLevel.THROTTLE_HINTS
+
+    @property
+    def skip_effects(self):
+        """Return whether visual effects are skipped."""
+        return self.level >= LoadLevel.SKIP_EFFECTS
+
+    @property
+    def drop_sounds(self):
+        """Return whether non-essential sounds are dropped."""
+        return self.level >= LoadLevel.DROP_SOUNDS
+
+    def allow_hint(self, userid):
+        """Return whether a hint message can be sent to the player."""
+        if not self.throttle_hints:
+            return True
+        return (
+            perf_counter() - self._hint_times.get(userid, 0) >= _HINT_INTERVAL
+        )
+
+    def send_hint(self, callback, userid, *args, **kwargs):
+        """Call the callback to send a hint if the player can get one.
+
+        The send time is only stored here, so hints that are queued but
+        dropped before being sent do not count against the player.
+        """
+        if not self.allow_hint(userid):
+            return
+        if self.throttle_hints:
+            self._hint_times[userid] = perf_counter()
+        callback(*args, **kwargs)
+
+    def start(self):
+        """Start measuring the load."""
+        if self._registered:
+            return
+        self._reset_window()
+        on_tick_listener_manager.register_listener(self._tick)
+        self._registered = True
+
+    def stop(self):
+        """Stop measuring the load and enable all features."""
+        if self._registered:
+            on_tick_listener_manager.unregister_listener(self._tick)
+            self._registered = False
+        self._set_level(LoadLevel.NORMAL, 'governor disabled')
+
+    def _reset_window(self):
+        """Reset the values of the current window."""
+        self._window_time = 0
+        self._window_ticks = 0
+
+    def _tick(self):
+        """Count the tick and check the load once per window."""
+        self._window_ticks += 1
+        if self._window_ticks * global_vars.interval_per_tick < 1:
+            return
+        self._check_load()
+        self._reset_window()
+
+    def _check_load(self):
+        """Step the level up or down based on the window's values."""
+        average = self._window_time * 1000 / self._window_ticks
+        budget = load_governor_budget.float_value
+        reason = '{average:.2f}ms GunGame time per tick'.format(
+            average=average,
+        )
+        if average > budget:
+            self._calm_windows = 0
+            if self.level < LoadLevel.DROP_SOUNDS:
+                self._set_level(LoadLevel(self.level + 1), reason)
+            return
+        if average > budget / 2:
+            self._calm_windows = 0
+            return
+        self._calm_windows += 1
+        if (
+            self._calm_windows >= _RECOVER_WINDOWS and
+            self.level > LoadLevel.NORMAL
+        ):
+            self._calm_windows = 0
+            self._set_level(LoadLevel(self.level - 1), reason)
+
+    def _set_level(self, level, reason):
+        """Set the level and log the change."""
+        if level == self.level:
+            return
+        gg_governor_logger.log_message(
+            'Load level changed from {old} to {new} ({reason}).'.format(
+                old=self.level.name,
+                new=level.name,
+                reason=reason,
+            )
+        )
+        self.level = level
+        if level < LoadLevel.THROTTLE_HINTS:
+            self._hint_times.clear()
+
+# The singleton object of the _LoadGovernor class.
+load_governor = _LoadGovernor()
+
+
+# =============================================================================
+# >> CONVAR CHANGE CALLBACKS
+# =============================================================================
+@ConVarChanged(load_governor_budget)
+def _budget_changed(convar):
+    """Start or stop the governor based on the budget."""
+    if convar.float_value > 0:
+        load_governor.start()
+    else:
+        load_governor.stop()
+
+
+# Start the governor if it is enabled by default
+_budget_changed(load_governor_budget)
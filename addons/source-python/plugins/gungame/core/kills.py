@@ -0,0 +1,283 @@
+# ../gungame/core/kills.py
+
+"""Player death pipeline functionality."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from collections import namedtuple
+from enum import IntEnum
+
+# Source.Python
+from core import AutoUnload
+from events import Event
+from hooks.exceptions import except_hooks
+from weapons.manager import weapon_manager
+
+# GunGame
+from .governor import load_governor
+from .players.dictionary import player_dictionary
+from .plugins.breaker import plugin_breaker
+from .status import GunGameStatus
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'KillContext',
+    'KillStage',
+    'KillType',
+    '_KillPipeline',
+    'kill_pipeline',
+)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class KillType(IntEnum):
+    """Player death classification values."""
+
+    # The attacker is no longer a valid player
+    UNKNOWN = -1
+
+    # The victim killed themselves or was killed by the world
+    SUICIDE = 0
+
+    # The victim was killed by a teammate
+    TEAM_KILL = 1
+
+    # The victim was killed by an enemy
+    ENEMY = 2
+
+
+class KillContext(namedtuple('KillContext', (
+    'userid', 'attacker', 'victim', 'killer', 'kill_type', 'weapon',
+    'weapon_basename',
+))):
+    """Immutable information about a single player_death event.
+
+    The values are copied from the event, since the GameEvent instance is
+    only valid while the event is being fired.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_event(cls, game_event):
+        """Return the context for the given player_death event.
+
+        None is returned if the victim is no longer a valid player.
+        """
+        userid = game_event['userid']
+        attacker = game_event['attacker']
+        try:
+            victim = player_dictionary[userid]
+        except ValueError:
+            return None
+
+        # Get the killer and the kill type
+        killer = None
+        if attacker in (userid, 0):
+            kill_type = KillType.SUICIDE
+        else:
+            try:
+                killer = player_dictionary[attacker]
+            except ValueError:
+                kill_type = KillType.UNKNOWN
+            else:
+                kill_type = (
+                    KillType.TEAM_KILL if killer.team == victim.team
+                    else KillType.ENEMY
+                )
+
+        # Get the weapon's basename
+        weapon = game_event['weapon']
+        try:
+            basename = weapon_manager[weapon].basename
+        except KeyError:
+            basename = weapon
+
+        return cls(
+            userid=userid,
+            attacker=attacker,
+            victim=victim,
+            killer=killer,
+            kill_type=kill_type,
+            weapon=weapon,
+            weapon_basename=basename,
+        )
+
+    @property
+    def is_level_weapon(self):
+        """Return whether the killer used their level weapon."""
+        return (
+            self.killer is not None and
+            self.weapon_basename == self.killer.level_weapon
+        )
+
+    @property
+    def is_suicide(self):
+        """Return whether the victim killed themselves."""
+        return self.kill_type is KillType.SUICIDE
+
+    @property
+    def is_team_kill(self):
+        """Return whether the victim was killed by a teammate."""
+        return self.kill_type is KillType.TEAM_KILL
+
+    @property
+    def is_enemy_kill(self):
+        """Return whether the victim was killed by an enemy."""
+        return self.kill_type is KillType.ENEMY
+
+
+class _KillPipeline(list):
+    """List used to store the ordered stages run on player_death.
+
+    Stages are indexed by the values their predicates check, so each death
+    only calls the stages whose predicates match it.
+    """
+
+    def __init__(self):
+        """Create the dictionary used to store the matching stages."""
+        super().__init__()
+        self._matching_stages = dict()
+        self._check_bots = False
+
+    def register_stage(self, stage):
+        """Add the stage, keeping stages ordered by priority."""
+        if stage in self:
+            raise ValueError('Stage already registered.')
+        if not callable(stage.callback):
+            raise ValueError('Callback is not callable.')
+        self.append(stage)
+        self.sort(key=lambda item: item.priority)
+        self._reset_index()
+
+    def unregister_stage(self, stage):
+        """Remove the stage from the pipeline."""
+        if stage not in self:
+            raise ValueError('Stage is not registered.')
+        self.remove(stage)
+        self._reset_index()
+
+    def _reset_index(self):
+        """Clear the stored matches since the stages changed."""
+        self._matching_stages.clear()
+        self._check_bots = any(
+            stage.killer_bot is not None or stage.victim_bot is not None
+            for stage in self
+        )
+
+    def get_matching_stages(self, context):
+        """Return the stages whose predicates match the given context."""
+        if self._check_bots:
+            killer_bot = (
+                None if context.killer is None
+                else context.killer.is_bot()
+            )
+            victim_bot = context.victim.is_bot()
+        else:
+            killer_bot = victim_bot = None
+        key = (
+            context.kill_type, context.weapon, GunGameStatus.MATCH,
+            killer_bot, victim_bot,
+        )
+        if key not in self._matching_stages:
+            self._matching_stages[key] = tuple(
+                stage for stage in self if stage.matches(context, *key[2:])
+            )
+        return self._matching_stages[key]
+
+    def run(self, game_event):
+        """Build the kill context and pass it to all matching stages."""
+        if not self:
+            return
+        with load_governor:
+            context = KillContext.from_event(game_event)
+            if context is None:
+                return
+            for stage in self.get_matching_stages(context):
+                try:
+                    stage.callback(context)
+                except Exception:
+                    except_hooks.print_exception()
+
+# The singleton object of the _KillPipeline class.
+kill_pipeline = _KillPipeline()
+
+
+class KillStage(AutoUnload):
+    """Decorator class used to register a player_death pipeline stage.
+
+    Stages with lower priority values are called first, and stages with
+    the same priority are called in the order they were registered.  The
+    stage is only called for deaths that match all of its predicates.
+    """
+
+    def __init__(
+        self, priority=0, kill_types=None, weapons=None, match_status=None,
+        killer_bot=None, victim_bot=None,
+    ):
+        """Store the priority and predicates."""
+        self.priority = priority
+        self.kill_types = self._get_set(kill_types)
+        self.weapons = self._get_set(weapons)
+        self.match_status = self._get_set(match_status)
+        self.killer_bot = killer_bot
+        self.victim_bot = victim_bot
+        self.callback = None
+
+    @staticmethod
+    def _get_set(values):
+        """Return the values as a frozenset, or None if not given."""
+        if values is None:
+            return None
+        if isinstance(values, (str, IntEnum)):
+            values = (values, )
+        return frozenset(values)
+
+    def __call__(self, callback):
+        """Store the callback and register the stage to the pipeline."""
+        self.callback = plugin_breaker.guard(callback)
+        kill_pipeline.register_stage(self)
+        return callback
+
+    def matches(self, context, match_status, killer_bot, victim_bot):
+        """Return whether the stage should be called for the context."""
+        if (
+            self.kill_types is not None and
+            context.kill_type not in self.kill_types
+        ):
+            return False
+        if self.weapons is not None and not (
+            context.weapon in self.weapons or
+            context.weapon_basename in self.weapons
+        ):
+            return False
+        if (
+            self.match_status is not None and
+            match_status not in self.match_status
+        ):
+            return False
+        if self.killer_bot is not None and killer_bot != self.killer_bot:
+            return False
+        if self.victim_bot is not None and victim_bot != self.victim_bot:
+            return False
+        return True
+
+    def _unload_instance(self):
+        """Unregister the stage from the pipeline."""
+        kill_pipeline.unregister_stage(self)
+
+
+# =============================================================================
+# >> GAME EVENTS
+# =============================================================================
+@Event('player_death')
+def _player_death(game_event):
+    """Run the kill pipeline for the player_death event."""
+    kill_pipeline.run(game_event)
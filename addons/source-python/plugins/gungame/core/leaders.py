@@ -5,21 +5,29 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
+# Python
+from bisect import bisect_left, insort
+from collections import defaultdict
+
 # Source.Python
-from filters.players import PlayerIter
+from listeners import OnLevelShutdown
 
 # GunGame
+from .config.misc import coalesce_leaders
 from .events.included.leaders import (
     GG_Leader_Disconnect, GG_Leader_Lost_Level, GG_New_Leader, GG_Tied_Leader,
 )
 from .messages import message_manager
 from .players.dictionary import player_dictionary
+from .players.roster import player_roster
+from .timers import timer_wheel
 
 
 # =============================================================================
 # >> ALL DECLARATION
 # =============================================================================
 __all__ = (
+    'LevelBuckets',
     '_LeaderManager',
     'leader_manager',
 )
@@ -28,7 +36,79 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class _LeaderManager(dict):
+class LevelBuckets(dict):
+    """Dictionary that also groups its keys by their level value.
+
+    Each key's level is stored as the dictionary value, while every level
+    also has a bucket containing the keys on that level.  The levels that
+    have keys are kept sorted, so the top two levels and the keys on them
+    can be retrieved without looping through every key or level.
+    """
+
+    def __init__(self):
+        """Create the level buckets."""
+        super().__init__()
+        self._levels = defaultdict(set)
+        self._sorted_levels = list()
+
+    def __setitem__(self, key, level):
+        """Move the key into the bucket of its new level."""
+        if key in self:
+            self._remove_from_level(key)
+        super().__setitem__(key, level)
+        if level not in self._levels:
+            insort(self._sorted_levels, level)
+        self._levels[level].add(key)
+
+    def __delitem__(self, key):
+        """Remove the key from its level's bucket."""
+        self._remove_from_level(key)
+        super().__delitem__(key)
+
+    def clear(self):
+        """Clear the dictionary and all level buckets."""
+        super().clear()
+        self._levels.clear()
+        self._sorted_levels.clear()
+
+    @property
+    def max_level(self):
+        """Return the highest level stored (1 if there are no keys)."""
+        if not self._sorted_levels:
+            return 1
+        return self._sorted_levels[-1]
+
+    @property
+    def second_level(self):
+        """Return the highest level below the max level (None if none)."""
+        if len(self._sorted_levels) < 2:
+            return None
+        return self._sorted_levels[-2]
+
+    def get_level_keys(self, level):
+        """Return a frozenset copy of the keys on the given level."""
+        return frozenset(self._levels.get(level, ()))
+
+    def is_on_level(self, key, level):
+        """Return whether the key is on the given level."""
+        return key in self._levels.get(level, ())
+
+    def get_level_count(self, level):
+        """Return the number of keys on the given level."""
+        return len(self._levels.get(level, ()))
+
+    def _remove_from_level(self, key):
+        """Remove the key from its current bucket."""
+        level = self[key]
+        bucket = self._levels[level]
+        bucket.discard(key)
+        if bucket:
+            return
+        del self._levels[level]
+        del self._sorted_levels[bisect_left(self._sorted_levels, level)]
+
+
+class _LeaderManager(LevelBuckets):
     """Class used to track leaders."""
 
     def __init__(self):
@@ -37,32 +117,51 @@ class _LeaderManager(dict):
         super().__init__()
 
         # Loop through all current players
-        for userid in [player.userid for player in PlayerIter()]:
+        for userid in list(player_roster.userids):
 
             # Add the player to the level dictionary
             self[userid] = player_dictionary[userid].level
 
+        # Store the values used to coalesce leader changes within a tick
+        self._pending_delay = None
+        self._pending_leaders = None
+        self._pending_level = 1
+        self._pending_roles = dict()
+
     @property
     def leader_level(self):
         """Return the level of the leader."""
-        return max(self.values() or [1])
+        return self.max_level
+
+    @property
+    def leaders(self):
+        """Return a frozenset of current leaders (empty if there are none)."""
+        if self.max_level == 1:
+            return frozenset()
+        return self.get_level_keys(self.max_level)
+
+    @property
+    def leader_count(self):
+        """Return the number of current leaders."""
+        if self.max_level == 1:
+            return 0
+        return self.get_level_count(self.max_level)
 
     @property
     def current_leaders(self):
         """Return a list of current leaders."""
-        # Get the current leader level
-        level = self.leader_level
-
         # Are there no leaders?
-        if level == 1:
+        if self.max_level == 1:
             return None
 
         # Return a list of players on the leader level
-        return [userid for userid in self if self[userid] == level]
+        return list(self.get_level_keys(self.max_level))
 
     def is_leading(self, userid):
         """Return whether the given player is a leader or not."""
-        return self[userid] == self.leader_level != 1
+        return self.max_level != 1 and self.is_on_level(
+            userid, self.max_level,
+        )
 
     def add_player(self, userid):
         """Add the player to the dictionary."""
@@ -73,14 +172,120 @@ class _LeaderManager(dict):
         # Get the player's new level
         player_level = player_dictionary[userid].level
         if player_level < self.leader_level:
+            self[userid] = player_level
+            return
+        if coalesce_leaders.bool_value:
+            self._store_pending_change(userid, player_level, 'leveler')
             return
         old_leaders = self._get_leader_string()
         old_level = self.leader_level
+        self[userid] = player_level
+        self._send_leader_increase(userid, old_leaders, old_level)
+
+    def player_level_down(self, userid):
+        """Set the player's level and see if the leaders changed."""
+        if not self.is_leading(userid):
+            self[userid] = player_dictionary[userid].level
+            return
+        if coalesce_leaders.bool_value:
+            self._store_pending_change(
+                userid, player_dictionary[userid].level, 'loser',
+            )
+            return
+        old_leaders = self._get_leader_string()
+        old_level = self[userid]
+        self[userid] = player_dictionary[userid].level
+        self._send_leader_decrease(userid, old_leaders, old_level)
+
+    def check_disconnect(self, userid):
+        """Remove the player and see if the leaders changed."""
+        # Send any pending changes first so the events stay in order
+        if self._pending_delay is not None:
+            self._pending_delay.cancel()
+            self._send_pending_changes()
+
+        if not self.is_leading(userid):
+            del self[userid]
+            return
+        old_leaders = self._get_leader_string()
+        old_level = self[userid]
+        del self[userid]
+        with GG_Leader_Disconnect() as event:
+            event.userid = userid
+            event.old_leaders = old_leaders
+            event.old_level = old_level
+            event.leaders = self._get_leader_string()
+            event.leader_level = self.leader_level
+        self._check_new_leaders(userid)
+
+    def _store_pending_change(self, userid, level, role):
+        """Set the player's level and wait until the end of the tick.
+
+        The leaders and leader level prior to the first change in the tick
+        are stored, so that only the net change gets sent once all of the
+        tick's level changes have happened.
+        """
+        if self._pending_delay is None:
+            self._pending_leaders = set(self.leaders)
+            self._pending_level = self.leader_level
+            self._pending_delay = timer_wheel.schedule(
+                0, self._send_pending_changes,
+            )
+        self._pending_roles[role] = userid
+        self[userid] = level
+
+    def clear_pending_changes(self):
+        """Drop the stored changes without sending them."""
+        if self._pending_delay is not None:
+            self._pending_delay.cancel()
+        self._pending_delay = None
+        self._pending_leaders = None
+        self._pending_level = 1
+        self._pending_roles.clear()
+
+    def _send_pending_changes(self):
+        """Send one event and message for the tick's net leader change."""
+        old_leaders = self._pending_leaders
+        old_level = self._pending_level
+        leveler = self._pending_roles.get('leveler')
+        loser = self._pending_roles.get('loser')
+        self._pending_delay = None
+        self._pending_leaders = None
+        self._pending_roles.clear()
+
+        current = self.leaders
+        new_level = self.leader_level
+        gained = current - old_leaders
+        lost = old_leaders - current
+        old_string = ','.join(map(str, old_leaders))
+
+        # Did the leader level decrease?
+        if new_level < old_level:
+            self._send_pending_decrease(loser, lost, old_string, old_level)
+
+        # Did the leader level increase or did any new players tie it?
+        elif current and (new_level > old_level or gained):
+            if leveler not in current:
+                leveler = min(gained or current)
+            self._send_leader_increase(leveler, old_string, old_level)
+
+        # Did any leaders lose a level?
+        elif lost:
+            self._send_pending_decrease(loser, lost, old_string, old_level)
+
+    def _send_pending_decrease(self, loser, lost, old_leaders, old_level):
+        """Send the lost level event for the tick's net leader decrease."""
+        if loser is None or loser not in lost:
+            loser = min(lost, default=loser)
+        if loser is not None:
+            self._send_leader_decrease(loser, old_leaders, old_level)
+
+    def _send_leader_increase(self, userid, old_leaders, old_level):
+        """Send the new or tied leader event and message."""
         player = player_dictionary[userid]
-        self[userid] = player.level
         new_leaders = self._get_leader_string()
         new_level = self.leader_level
-        count = len(self.current_leaders)
+        count = self.leader_count
         if count > 1:
             with GG_Tied_Leader() as event:
                 event.userid = event.leveler = userid
@@ -109,47 +314,24 @@ class _LeaderManager(dict):
                 player=player,
             )
 
-    def player_level_down(self, userid):
-        """Set the player's level and see if the leaders changed."""
-        if not self.is_leading(userid):
-            self[userid] = player_dictionary[userid].level
-            return
-        old_leaders = self._get_leader_string()
-        old_level = self[userid]
-        self[userid] = player_dictionary[userid].level
-        new_level = self.leader_level
+    def _send_leader_decrease(self, userid, old_leaders, old_level):
+        """Send the lost level event and any new leader messages."""
         with GG_Leader_Lost_Level() as event:
             event.userid = event.leveler = userid
             event.old_leaders = old_leaders
             event.old_level = old_level
             event.leaders = self._get_leader_string()
-            event.leader_level = new_level
-        self._check_new_leaders(userid)
-
-    def check_disconnect(self, userid):
-        """Remove the player and see if the leaders changed."""
-        if not self.is_leading(userid):
-            del self[userid]
-            return
-        old_leaders = self._get_leader_string()
-        old_level = self[userid]
-        del self[userid]
-        with GG_Leader_Disconnect() as event:
-            event.userid = userid
-            event.old_leaders = old_leaders
-            event.old_level = old_level
-            event.leaders = self._get_leader_string()
             event.leader_level = self.leader_level
         self._check_new_leaders(userid)
 
     def _check_new_leaders(self, userid):
         """Check to see if the leaders changed and send messages."""
-        current = self.current_leaders
-        if current is None or (len(current) == 1 and userid in current):
+        current = self.leaders
+        if not current or (len(current) == 1 and userid in current):
             return
         level = self.leader_level
         if len(current) == 1:
-            player = player_dictionary[current[0]]
+            player = player_dictionary[next(iter(current))]
             message_manager.chat_message(
                 'Leader:New:Singular',
                 player.index,
@@ -165,9 +347,15 @@ class _LeaderManager(dict):
 
     def _get_leader_string(self):
         """Return a string of leader userids."""
-        leaders = self.current_leaders
-        if leaders is None:
-            return ''
-        return ','.join(map(str, leaders))
+        return ','.join(map(str, self.leaders))
 
 leader_manager = _LeaderManager()
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    """Drop the leader changes that have not been sent on map change."""
+    leader_manager.clear_pending_changes()
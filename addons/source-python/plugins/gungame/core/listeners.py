@@ -8,17 +8,15 @@
 # Source.Python
 from colors import BLUE, RED, WHITE
 from cvars import ConVar
-from entities.entity import Entity
 from events import Event
-from filters.entities import EntityIter
 from listeners import OnLevelInit, OnLevelShutdown
 from listeners.tick import Delay
-from weapons.manager import weapon_manager
 
 # GunGame
+from .config.manager import ConVarChanged
 from .config.misc import (
-    allow_kills_after_round, cancel_on_fire, dynamic_chat_time, give_armor,
-    give_defusers, level_on_protect,
+    allow_kills_after_round, cancel_on_fire, dynamic_chat_time,
+    level_on_protect,
 )
 from .config.punishment import (
     level_one_team_kill, suicide_punish, team_kill_punish,
@@ -27,13 +25,22 @@ from .config.warmup import enabled as warmup_enabled, weapon as warmup_weapon
 from .config.weapon import (
     order_file, order_randomize, multi_kill_override, prop_physics
 )
+from .cosmetics import CosmeticPriority, cosmetic_queue
 from .credits import gungame_credits
+from .entity_budget import entity_budget
+from .entity_index import entity_index
+from .events.bus import GGEvent
+from .events.conditional import ConditionalEvent
 from .events.included.match import GG_Start
+from .governor import load_governor
+from .kills import KillStage
 from .leaders import leader_manager
 from .messages import message_manager
 from .players.attributes import AttributePostHook
 from .players.dictionary import player_dictionary
+from .scratch import ScratchDict
 from .sounds.manager import sound_manager
+from .spawns import send_level_info
 from .status import GunGameMatchStatus, GunGameRoundStatus, GunGameStatus
 from .warmup import warmup_manager
 from .weapons.manager import weapon_order_manager
@@ -53,106 +60,48 @@ __all__ = (
 # Create a set to store userids that have already had join messages
 _joined_players = set()
 
-# Create a set to store userids that have recently switched teams
-_team_changers = set()
+# Store userids that have switched teams in the last 0.2 seconds
+_team_changers = ScratchDict(seconds=0.2)
 
 
 # =============================================================================
 # >> PLAYER GAME EVENTS
 # =============================================================================
-@Event('player_spawn')
-def _player_spawn(game_event):
-    """Give the player their level weapon."""
-    # Is GunGame active?
-    if GunGameStatus.MATCH is not GunGameMatchStatus.ACTIVE:
-        return
-
-    # Use try/except to get the player's instance
-    try:
-        player = player_dictionary[game_event['userid']]
-    except ValueError:
-        return
-
-    # Verify that the player is on a team
-    if player.team < 2:
-        return
-
-    # Spawn protection
-    player.give_spawn_protection()
-
-    # Give the player their new weapon
-    player.strip_weapons()
-    player.give_level_weapon()
-
-    # Give CTs defusers, if need be
-    if player.team == 3 and give_defusers.get_bool():
-        player.has_defuser = True
-
-    # Give player armor, if necessary
-    armor_type = {1: 'kevlar', 2: 'assaultsuit'}.get(give_armor.get_int())
-    if armor_type is not None:
-        equip = Entity.find_or_create('game_player_equip')
-        equip.add_output(
-            'item_{armor_type} 1'.format(
-                armor_type=armor_type
-            ),
-            caller=player,
-            activator=player,
-        )
-
-    # Skip bots
-    if player.is_fake_client():
-        return
-
-    # Send the player their level information
-    _send_level_info(player)
-
-
-@Event('player_death')
-def _player_death(game_event):
+@KillStage(match_status=GunGameMatchStatus.ACTIVE)
+def _player_death(context):
     """Award the killer with a multi-kill increase or level increase."""
-    # Is GunGame active?
-    if GunGameStatus.MATCH is not GunGameMatchStatus.ACTIVE:
-        return
-
     # Is the round active or should kills after the round count?
     if (
         GunGameStatus.ROUND is GunGameRoundStatus.INACTIVE and
-        not allow_kills_after_round.get_int()
+        not allow_kills_after_round.int_value
     ):
         return
 
-    # Get the victim
-    userid = game_event['userid']
-
-    # Get the attacker
-    attacker = game_event['attacker']
-
     # Was this a suicide?
-    if attacker in (userid, 0):
-        _punish_suicide(userid)
+    if context.is_suicide:
+        _punish_suicide(context.userid)
         return
 
-    # Get the victim's instance
-    victim = player_dictionary[userid]
+    # Is the attacker no longer a valid player?
+    if context.killer is None:
+        return
 
     # Get the attacker's instance
-    killer = player_dictionary[attacker]
+    killer = context.killer
 
     # Was this a team-kill?
-    if victim.team == killer.team:
+    if context.is_team_kill:
         _punish_team_kill(killer)
         return
 
-    if killer.in_spawn_protection and not level_on_protect.get_int():
+    if killer.in_spawn_protection and not level_on_protect.int_value:
         return
 
     # Did the killer kill using their level's weapon?
-    weapon = game_event['weapon']
-    if weapon != 'prop_physics':
-        if weapon_manager[weapon].basename != killer.level_weapon:
+    if context.weapon != 'prop_physics':
+        if not context.is_level_weapon:
             return
-    elif not prop_physics.get_int():
+    elif not prop_physics.int_value:
         return
 
     # Increase the killer's multi_kill
@@ -168,7 +117,7 @@ def _player_death(game_event):
     killer.increase_level(
         levels=1,
         reason='kill',
-        victim=userid,
+        victim=context.userid,
     )
 
 
@@ -192,7 +141,7 @@ def _player_activate(game_event):
     player = player_dictionary[userid]
 
     # Is the player a bot?
-    if player.is_fake_client():
+    if player.is_bot():
         return
 
     if player.wins:
@@ -226,18 +175,13 @@ def _player_team(game_event):
     userid = game_event['userid']
     if userid in _team_changers:
         return
-    _team_changers.add(userid)
-    Delay(0.2, _team_changers.remove, (userid, ))
+    _team_changers[userid] = True
 
 
-@Event('weapon_fire')
+@ConditionalEvent('weapon_fire', convars=(cancel_on_fire, ))
 def _weapon_fire(game_event):
-    if not cancel_on_fire.get_int():
-        return
     player = player_dictionary[game_event['userid']]
-    if not player.in_spawn_protection:
-        return
-    if cancel_on_fire.get_int():
+    if player.in_spawn_protection:
         player.remove_spawn_protection()
 
 
@@ -248,7 +192,7 @@ def _weapon_fire(game_event):
 def _round_start(game_event):
     """Disable buyzones and set the round status to ACTIVE."""
     GunGameStatus.ROUND = GunGameRoundStatus.ACTIVE
-    for entity in EntityIter('func_buyzone'):
+    for entity in entity_index.iter_entities('func_buyzone'):
         entity.disable()
 
 
@@ -261,45 +205,34 @@ def _round_end(game_event):
 # =============================================================================
 # >> MISC GAME EVENTS
 # =============================================================================
-@Event('server_cvar')
-def _server_cvar(game_event):
-    """Set the weapon order value if the ConVar is for the weapon order."""
-    if GunGameStatus.MATCH == GunGameMatchStatus.UNLOADING:
-        return
-
-    # Get the ConVar name and its new value
-    cvarname = game_event['cvarname']
-    cvarvalue = game_event['cvarvalue']
+@ConVarChanged(order_file)
+def _order_file_changed(convar):
+    """Set the new weapon order."""
+    weapon_order_manager.set_active_weapon_order(convar.string_value)
 
-    # Did the weapon order change?
-    if cvarname == order_file.name:
 
-        # Set the new weapon order
-        weapon_order_manager.set_active_weapon_order(cvarvalue)
+@ConVarChanged(order_randomize)
+def _order_randomize_changed(convar):
+    """Set the randomize value."""
+    weapon_order_manager.set_randomize(convar.bool_value)
 
-    # Did the randomize value change?
-    elif cvarname == order_randomize.name:
 
-        # Set the randomize value
-        weapon_order_manager.set_randomize(cvarvalue)
-
-    # Did the multi_kill override value change?
-    elif cvarname == multi_kill_override.name:
-
-        # Print out the new weapon order
-        weapon_order_manager.print_order()
+@ConVarChanged(multi_kill_override)
+def _multi_kill_override_changed(convar):
+    """Print out the new weapon order."""
+    weapon_order_manager.print_order()
 
-    # Did the warmup weapon change?
-    elif cvarname == warmup_weapon.name:
 
-        # Set the new warmup weapon
-        warmup_manager.set_warmup_weapon()
+@ConVarChanged(warmup_weapon)
+def _warmup_weapon_changed(convar):
+    """Set the new warmup weapon."""
+    warmup_manager.set_warmup_weapon()
 
 
 # =============================================================================
 # >> GUNGAME EVENTS
 # =============================================================================
-@Event('gg_win')
+@GGEvent('gg_win')
 def _gg_win(game_event):
     """Increase the win total for the winner and end the map."""
     # Set the match status
@@ -338,21 +271,21 @@ def _gg_win(game_event):
     winner_sound = sound_manager.play_sound('winner')
 
     # Set the dynamic chat time, if needed
-    if dynamic_chat_time.get_bool():
+    if dynamic_chat_time.bool_value:
         ConVar('mp_chattime').set_float(winner_sound.duration)
 
     # End the match to move to the next map
-    entity = Entity.find_or_create('game_end')
+    entity = entity_budget.get_helper('game_end')
     entity.end_game()
 
 
-@Event('gg_map_end')
+@GGEvent('gg_map_end')
 def _gg_map_end(game_event):
     """Set the match status to POST after the map has ended."""
     GunGameStatus.MATCH = GunGameMatchStatus.POST
 
 
-@Event('gg_start')
+@GGEvent('gg_start')
 def _gg_start(game_event):
     """Set the match status to ACTIVE and post the weapon order."""
     # Set the match status
@@ -362,22 +295,33 @@ def _gg_start(game_event):
     weapon_order_manager.print_order()
 
 
-@Event('gg_level_up')
+@GGEvent('gg_level_up')
 def _gg_level_up(game_event):
     """Increase the player leader level and send level info."""
     userid = game_event['leveler']
     leader_manager.player_level_up(userid)
     player = player_dictionary[userid]
-    player.play_sound('level_up')
-    _send_level_info(player)
+    if player.is_bot():
+        return
+    if not load_governor.drop_sounds:
+        cosmetic_queue.add(player.play_sound, 'level_up', userid=userid)
+    if load_governor.allow_hint(userid):
+        cosmetic_queue.add(
+            load_governor.send_hint, send_level_info, userid, player,
+            priority=CosmeticPriority.HIGH,
+            userid=userid,
+        )
 
 
-@Event('gg_level_down')
+@GGEvent('gg_level_down')
 def _gg_level_down(game_event):
     """Set the player's level in the leader dictionary."""
     userid = game_event['leveler']
     leader_manager.player_level_down(userid)
-    player_dictionary[userid].play_sound('level_down')
+    player = player_dictionary[userid]
+    if load_governor.drop_sounds or player.is_bot():
+        return
+    cosmetic_queue.add(player.play_sound, 'level_down', userid=userid)
 
 
 # =============================================================================
@@ -413,18 +357,28 @@ def _post_multi_kill(player, attribute, new_value, old_value):
     if not new_value:
         return
 
+    # Is the player a bot?
+    if player.is_bot():
+        return
+
     # Is the player going to level up?
     multi_kill = player.level_multi_kill
     if multi_kill == new_value:
         return
 
     # Send the multi_kill message
-    player.hint_message(
-        message='LevelInfo:Current:Kills',
-        kills=new_value,
-        total=multi_kill,
-    )
-    player.play_sound('multi_kill')
+    userid = player.userid
+    if load_governor.allow_hint(userid):
+        cosmetic_queue.add(
+            load_governor.send_hint, player.hint_message, userid,
+            message='LevelInfo:Current:Kills',
+            kills=new_value,
+            total=multi_kill,
+            priority=CosmeticPriority.HIGH,
+            userid=userid,
+        )
+    if not load_governor.drop_sounds:
+        cosmetic_queue.add(player.play_sound, 'multi_kill', userid=userid)
 
 
 # =============================================================================
@@ -433,7 +387,7 @@ def _post_multi_kill(player, attribute, new_value, old_value):
 def start_match():
     """Start the match if not already started or on hold."""
     # Is warmup supposed to happen?
-    if warmup_enabled.get_int():
+    if warmup_enabled.int_value:
 
         # Start warmup
         warmup_manager.start_warmup()
@@ -446,80 +400,8 @@ def start_match():
         GG_Start().fire()
 
 
-def _send_level_info(player):
-    """Send level information to the given player."""
-    # Get the player's language
-    language = player.language
-
-    # Get the player's current level information
-    text = message_manager['LevelInfo:Current:Level'].get_string(
-        language,
-        player=player,
-        total=weapon_order_manager.max_levels,
-    )
-
-    # Add the player's weapon information to the message
-    text += message_manager['LevelInfo:Current:Weapon'].get_string(
-        language,
-        player=player,
-    )
-
-    # Get the player's current level's multi_kill value
-    multi_kill = player.level_multi_kill
-
-    # If the multi_kill value is not 1, add the multi_kill to the message
-    if multi_kill > 1:
-        text += message_manager['LevelInfo:Current:Kills'].get_string(
-            language,
-            kills=player.multi_kill,
-            total=player.level_multi_kill,
-        ) + '\n'
-
-    # Get the current leaders
-    leaders = leader_manager.current_leaders
-
-    # Get the leader's level
-    leader_level = leader_manager.leader_level
-
-    # Are there no leaders?
-    if leaders is None:
-
-        # Add the no leaders text to the message
-        text += message_manager['LevelInfo:Leaders:None'].get_string(language)
-
-    # Is the player the only current leader?
-    elif len(leaders) == 1 and player.userid in leaders:
-
-        # Add the current leader text to the message
-        text += message_manager[
-            'LevelInfo:Current:Leader'
-        ].get_string(language)
-
-    # Is the player one of multiple current leaders?
-    elif len(leaders) > 1 and player.userid in leaders:
-
-        # Add the amongst leaders text to the message
-        text += message_manager[
-            'LevelInfo:Leaders:Among'
-        ].get_string(language)
-
-    # Is the player not one of the current leaders?
-    else:
-
-        # Add the current leader text to the message
-        text += message_manager['LevelInfo:Leaders:Level'].get_string(
-            language,
-            level=leader_level,
-            total=weapon_order_manager.max_levels,
-            weapon=weapon_order_manager.active[leader_level].weapon,
-        )
-
-    # Send the player's level information message
-    player.hint_message(message=text)
-
-
 def _punish_suicide(userid):
-    levels = suicide_punish.get_int()
+    levels = suicide_punish.int_value
     if not levels:
         return
 
@@ -544,12 +426,12 @@ def _punish_suicide(userid):
 
 
 def _punish_team_kill(player):
-    levels = team_kill_punish.get_int()
+    levels = team_kill_punish.int_value
     if not levels:
         return
 
     if player.levels == 1:
-        if level_one_team_kill.get_int():
+        if level_one_team_kill.int_value:
             player.slay()
             player.chat_message(
                 message='Punishment:TeamKill:Slay',
@@ -39,14 +39,11 @@ def send_leaders_menu(index):
         menu.append(menu_strings['Inactive'])
     elif gg_plugin_manager.is_team_game:
         menu.append(menu_strings['Leader:Team'])
-        leader_level = max(team_levels.values())
-        teams = [
-            team_names[num] for num, level in team_levels.items()
-            if level == leader_level
-        ]
+        leader_level = team_levels.leader_level
+        teams = [team_names[num] for num in sorted(team_levels.leaders)]
         weapon = weapon_order_manager.active[leader_level].weapon
 
-        if len(teams) == len(team_levels):
+        if team_levels.is_tied:
             if len(teams) > 2:
                 message = menu_strings['Leader:Team:All'].get_string(
                     language=language,
@@ -76,7 +73,7 @@ def send_leaders_menu(index):
                 weapon=weapon,
             )
         menu.append(StarOption(message))
-    elif leader_manager.current_leaders is None:
+    elif not leader_manager.leader_count:
         menu.append(menu_strings['Leader:None'])
     else:
         level = leader_manager.leader_level
@@ -85,6 +82,6 @@ def send_leaders_menu(index):
             level=level,
             weapon=weapon_order_manager.active[level].weapon,
         )
-        for userid in leader_manager.current_leaders:
+        for userid in leader_manager.leaders:
             menu.append(StarOption(player_dictionary[userid].name))
     menu.send(index)
@@ -48,11 +48,8 @@ def send_level_menu(index):
             menu.append(Text(menu_strings['Level:Inactive']))
         else:
             team_level = team_levels[player.team]
-            leader_level = max(team_levels.values())
-            teams = [
-                team_names[num] for num, level in team_levels.items()
-                if level == leader_level
-            ]
+            leader_level = team_levels.leader_level
+            teams = [team_names[num] for num in sorted(team_levels.leaders)]
             menu.append(
                 menu_strings['Level:Team'].get_string(
                     language=language,
@@ -67,16 +64,13 @@ def send_level_menu(index):
                     )
                 )
             elif len(teams) == 1:
-                second_place = max([
-                    x for x in team_levels.values() if x != leader_level
-                ])
                 menu.append(
                     menu_strings['Level:Team:Leading'].get_string(
                         language=language,
-                        levels=leader_level - second_place
+                        levels=team_levels.lead_margin,
                     )
                 )
-            elif len(teams) == len(team_levels):
+            elif team_levels.is_tied:
                 if len(teams) == 2:
                     menu.append(menu_strings['Level:Team:Tied'])
                 else:
@@ -109,10 +103,9 @@ def send_level_menu(index):
                 )
             )
         )
-        leaders = leader_manager.current_leaders
-        if leaders is None:
+        if not leader_manager.leader_count:
             menu.append(Text(menu_strings['Leader:None']))
-        elif player.userid not in leaders:
+        elif player.userid not in leader_manager.leaders:
             menu.append(
                 Text(
                     menu_strings['Level:Trailing'].get_string(
@@ -121,7 +114,7 @@ def send_level_menu(index):
                     )
                 )
             )
-        elif len(leaders) > 1:
+        elif leader_manager.leader_count > 1:
             menu.append(Text(menu_strings['Level:Tied']))
         else:
             menu.append(Text(menu_strings['Level:Leading']))
@@ -36,11 +36,7 @@ def send_score_menu(index):
     if GunGameStatus.MATCH is not GunGameMatchStatus.ACTIVE:
         menu.append(menu_strings['Inactive'])
     elif gg_plugin_manager.is_team_game:
-        for team in sorted(
-            team_levels,
-            key=lambda x: team_levels[x],
-            reverse=True,
-        ):
+        for team in team_levels.ordered:
             menu.append(
                 ListOption(
                     choice_index=team_levels[team],
@@ -19,6 +19,7 @@ from translations.strings import LangStrings, TranslationStrings
 
 # GunGame
 from .paths import GUNGAME_TRANSLATION_PATH
+from .players.roster import player_roster
 
 
 # =============================================================================
@@ -100,6 +101,11 @@ class _MessageManager(dict):
 
     def center_message(self, message='', *users, **tokens):
         """Send a center message to the given players."""
+        # Are all of the given players bots?
+        users = self._get_recipients(users)
+        if users is None:
+            return
+
         # Get the message to send
         message = self._get_message(message)
 
@@ -116,6 +122,11 @@ class _MessageManager(dict):
 
     def chat_message(self, message='', index=0, *users, **tokens):
         """Send a chat message to the given players."""
+        # Are all of the given players bots?
+        users = self._get_recipients(users)
+        if users is None:
+            return
+
         # Get the message to send
         message = self._get_message(message)
 
@@ -132,6 +143,11 @@ class _MessageManager(dict):
 
     def echo_message(self, message='', *users, **tokens):
         """Send an echo message to the given players."""
+        # Are all of the given players bots?
+        users = self._get_recipients(users)
+        if users is None:
+            return
+
         # Get the message to send
         message = self._get_message(message)
 
@@ -148,6 +164,11 @@ class _MessageManager(dict):
 
     def hint_message(self, message='', *users, **tokens):
         """Send a hint message to the given players."""
+        # Are all of the given players bots?
+        users = self._get_recipients(users)
+        if users is None:
+            return
+
         # Get the message to send
         message = self._get_message(message)
 
@@ -168,6 +189,11 @@ class _MessageManager(dict):
         hold=4.0, fx_time=0.0, channel=0, *users, **tokens
     ):
         """Send a hud message to the given players."""
+        # Are all of the given players bots?
+        users = self._get_recipients(users)
+        if users is None:
+            return
+
         # Get the message to send
         message = self._get_message(message)
 
@@ -187,6 +213,11 @@ class _MessageManager(dict):
 
     def keyhint_message(self, message='', *users, **tokens):
         """Send a keyhint message to the given players."""
+        # Are all of the given players bots?
+        users = self._get_recipients(users)
+        if users is None:
+            return
+
         # Get the message to send
         message = self._get_message(message)
 
@@ -206,6 +237,11 @@ class _MessageManager(dict):
         message='', visible=True, *users, **tokens
     ):
         """Send a motd message to the given players."""
+        # Are all of the given players bots?
+        users = self._get_recipients(users)
+        if users is None:
+            return
+
         # Get the message to send
         message = self._get_message(message)
 
@@ -227,6 +263,11 @@ class _MessageManager(dict):
         self, message='', color=WHITE, time=4, *users, **tokens
     ):
         """Send a toptext message to the given players."""
+        # Are all of the given players bots?
+        users = self._get_recipients(users)
+        if users is None:
+            return
+
         # Get the message to send
         message = self._get_message(message)
 
@@ -241,6 +282,14 @@ class _MessageManager(dict):
         # Send the message to the users
         DialogMsg(message, color, time).send(*users, **tokens)
 
+    @staticmethod
+    def _get_recipients(users):
+        """Return the given users without bots (None if only bots)."""
+        if not users:
+            return users
+        users = player_roster.get_human_indexes(users)
+        return users or None
+
     def _get_message(self, message):
         """Get the message to send."""
         # Is the message a set of translations?
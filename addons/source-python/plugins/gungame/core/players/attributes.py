@@ -2,6 +2,12 @@
 
 """Player attribute functionality."""
 
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# GunGame
+from ..plugins.breaker import plugin_breaker
+
 
 # =============================================================================
 # >> ALL DECLARATION
@@ -116,7 +122,7 @@ class _AttributeHooks(dict):
 
     def register_callback(self, attribute, callback):
         """Add the callback to the attribute's list."""
-        self[attribute].append(callback)
+        self[attribute].append(plugin_breaker.guard(callback))
 
     def unregister_callback(self, attribute, callback):
         """Verify the attribute before removing the callback."""
@@ -7,7 +7,6 @@
 # =============================================================================
 # Source.Python
 from colors import WHITE
-from listeners.tick import Delay
 from players.entity import Player
 from weapons.manager import weapon_manager
 
@@ -22,6 +21,7 @@ from .attributes import (
 from .database import winners_database
 from ..sounds.manager import sound_manager
 from ..status import GunGameMatchStatus, GunGameStatus
+from ..timers import timer_wheel
 from ..weapons.manager import weapon_order_manager
 
 
@@ -109,10 +109,11 @@ class GunGamePlayer(Player):
             return
         self.multi_kill = 0
         if delay:
-            Delay(
+            timer_wheel.schedule(
                 delay=0,
                 callback=self._fire_level_up,
-                args=(victim, old_level, new_level, reason)
+                args=(victim, old_level, new_level, reason),
+                owner=self.userid,
             )
         else:
             self._fire_level_up(victim, old_level, new_level, reason)
@@ -144,10 +145,11 @@ class GunGamePlayer(Player):
             return
         self.multi_kill = 0
         if delay:
-            Delay(
+            timer_wheel.schedule(
                 delay=0,
                 callback=self._fire_level_down,
-                args=(attacker, old_level, new_level, reason)
+                args=(attacker, old_level, new_level, reason),
+                owner=self.userid,
             )
         else:
             self._fire_level_down(attacker, old_level, new_level, reason)
@@ -204,18 +206,26 @@ class GunGamePlayer(Player):
     # =========================================================================
     def center_message(self, message='', **tokens):
         """Send a center message to the player."""
+        if self.is_bot():
+            return
         message_manager.center_message(message, self.index, **tokens)
 
     def chat_message(self, message='', index=0, **tokens):
         """Send a chat message to the player."""
+        if self.is_bot():
+            return
         message_manager.chat_message(message, index, self.index, **tokens)
 
     def echo_message(self, message='', **tokens):
         """Send an echo message to the player."""
+        if self.is_bot():
+            return
         message_manager.echo_message(message, self.index, **tokens)
 
     def hint_message(self, message='', **tokens):
         """Send a hint message to the player."""
+        if self.is_bot():
+            return
         message_manager.hint_message(message, self.index, **tokens)
 
     def hud_message(
@@ -224,6 +234,8 @@ class GunGamePlayer(Player):
         hold=4.0, fx_time=0.0, channel=0, **tokens
     ):
         """Send a hud message to the player."""
+        if self.is_bot():
+            return
         message_manager.hud_message(
             message, x, y, color1, color2, effect, fade_in,
             fade_out, hold, fx_time, channel, self.index, **tokens
@@ -231,37 +243,75 @@ class GunGamePlayer(Player):
 
     def keyhint_message(self, message='', **tokens):
         """Send a keyhint message to the player."""
+        if self.is_bot():
+            return
         message_manager.keyhint_message(message, self.index, **tokens)
 
     def motd_message(
         self, panel_type=2, title='', message='', visible=True, **tokens
     ):
         """Send a motd message to the player."""
+        if self.is_bot():
+            return
         message_manager.motd_message(
             panel_type, title, message, visible, self.index, **tokens
         )
 
     def top_message(self, message='', color=WHITE, time=4, **tokens):
         """Send a toptext message to the player."""
+        if self.is_bot():
+            return
         message_manager.top_message(message, color, time, self.index, **tokens)
 
     # =========================================================================
     # >> SPAWN PROTECT FUNCTIONALITY
     # =========================================================================
-    def give_spawn_protection(self):
-        delay = spawn_protection.get_float()
-        if delay <= 0:
-            return
+    def give_spawn_protection(self, protect_delay=None):
+        """Give the player spawn protection.
+
+        A timer shared with other players that spawned on the same tick can
+        be given, in which case that timer removes the protection.
+        """
+        if protect_delay is None:
+            delay = spawn_protection.float_value
+            if delay <= 0:
+                return
+        # Cancel the player's own timer so it cannot end the new protection
+        if (
+            self._protect_delay is not None and
+            self._protect_delay.callback == self.remove_spawn_protection
+        ):
+            self._protect_delay.cancel()
+
+        # Keep the original color if the player is already protected
+        if not self.in_spawn_protection:
+            self._color = self.color
         self.in_spawn_protection = True
         self.godmode = True
-        self._color = self.color
-        self.color = self.color.with_alpha(100)
-        self._protect_delay = Delay(delay, self.remove_spawn_protection)
+        self.color = self._color.with_alpha(100)
+        if protect_delay is None:
+            protect_delay = timer_wheel.schedule(
+                delay, self.remove_spawn_protection, owner=self.userid,
+            )
+        self._protect_delay = protect_delay
+
+    def remove_spawn_protection(self, protect_delay=None):
+        """Remove the player's spawn protection.
 
-    def remove_spawn_protection(self):
+        A shared timer passes itself, so protection given after it is kept.
+        """
         if self._protect_delay is None:
             return
-        self._protect_delay.cancel()
+        if protect_delay is not None:
+            if protect_delay is not self._protect_delay:
+                return
+
+        # Only cancel the timer if it belongs to this player
+        elif (
+            self._protect_delay.running and
+            self._protect_delay.callback == self.remove_spawn_protection
+        ):
+            self._protect_delay.cancel()
         self._protect_delay = None
         self.godmode = False
         self.color = self._color
@@ -272,6 +322,8 @@ class GunGamePlayer(Player):
     # =========================================================================
     def play_sound(self, sound):
         """Play the sound to the player."""
+        if self.is_bot():
+            return
         sound_manager.play_sound(sound, self.index)
 
     def emit_sound(self, sound):
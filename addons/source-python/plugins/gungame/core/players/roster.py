@@ -0,0 +1,216 @@
+# ../gungame/core/players/roster.py
+
+"""Event-maintained index of players by team, type, and life state."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from collections import defaultdict
+
+# Source.Python
+from events import Event
+from filters.players import PlayerIter
+from listeners import OnLevelShutdown
+from players.entity import Player
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    '_PlayerRoster',
+    'player_roster',
+)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _PlayerRoster(object):
+    """Class used to store current players by team, type, and life state.
+
+    The sets are kept current from game events, so counts and team members
+    can be retrieved without iterating over the players on the server.
+    """
+
+    def __init__(self):
+        """Store the base sets and add all current players."""
+        self.teams = defaultdict(set)
+        self.team_humans = defaultdict(set)
+        self.humans = set()
+        self.bots = set()
+        self.bot_indexes = set()
+        self.alive = set()
+        self._player_teams = dict()
+        self._indexes = dict()
+
+        # Loop through all current players
+        for player in PlayerIter():
+            self.add_player(
+                player.userid, player.index, player.team,
+                player.is_fake_client(), not player.dead,
+            )
+
+    @property
+    def userids(self):
+        """Return all userids in the roster."""
+        return self._player_teams.keys()
+
+    @property
+    def active_human_count(self):
+        """Return the number of humans on a playing team."""
+        return sum(
+            len(userids) for team, userids in self.team_humans.items()
+            if team > 1
+        )
+
+    def __contains__(self, userid):
+        """Return whether the userid is in the roster."""
+        return userid in self._player_teams
+
+    def __len__(self):
+        """Return the number of players in the roster."""
+        return len(self._player_teams)
+
+    def add_player(self, userid, index, team, is_bot, is_alive=False):
+        """Add the player to the roster."""
+        self.remove_player(userid)
+        self._player_teams[userid] = team
+        self._indexes[userid] = index
+        self.teams[team].add(userid)
+        if is_bot:
+            self.bots.add(userid)
+            self.bot_indexes.add(index)
+        else:
+            self.humans.add(userid)
+            self.team_humans[team].add(userid)
+        if is_alive and team > 1:
+            self.alive.add(userid)
+
+    def remove_player(self, userid):
+        """Remove the player from the roster."""
+        team = self._player_teams.pop(userid, None)
+        if team is None:
+            return
+        index = self._indexes.pop(userid)
+        if userid in self.bots:
+            self.bot_indexes.discard(index)
+        self.teams[team].discard(userid)
+        self.team_humans[team].discard(userid)
+        self.humans.discard(userid)
+        self.bots.discard(userid)
+        self.alive.discard(userid)
+
+    def set_team(self, userid, team):
+        """Move the player to the given team."""
+        old_team = self._player_teams.get(userid)
+        if old_team is None or old_team == team:
+            return
+        self._player_teams[userid] = team
+        self.teams[old_team].discard(userid)
+        self.teams[team].add(userid)
+        if userid in self.humans:
+            self.team_humans[old_team].discard(userid)
+            self.team_humans[team].add(userid)
+        if team < 2:
+            self.alive.discard(userid)
+
+    def set_alive(self, userid, is_alive):
+        """Set whether the player is alive."""
+        if is_alive and self._player_teams.get(userid, 0) > 1:
+            self.alive.add(userid)
+        else:
+            self.alive.discard(userid)
+
+    def get_team(self, team):
+        """Return the set of userids on the given team."""
+        return self.teams.get(team, frozenset())
+
+    def get_team_count(self, team):
+        """Return the number of players on the given team."""
+        return len(self.teams.get(team, ()))
+
+    def get_team_index(self, team):
+        """Return the index of any player on the team (0 if empty)."""
+        userids = self.teams.get(team)
+        if not userids:
+            return 0
+        return self._indexes[next(iter(userids))]
+
+    def get_player_team(self, userid):
+        """Return the team of the given player (None if not stored)."""
+        return self._player_teams.get(userid)
+
+    def is_bot(self, userid):
+        """Return whether the given player is a bot."""
+        return userid in self.bots
+
+    def get_human_indexes(self, indexes):
+        """Return the given indexes without any that belong to bots."""
+        if not self.bot_indexes:
+            return indexes
+        return tuple(
+            index for index in indexes if index not in self.bot_indexes
+        )
+
+    def clear(self):
+        """Remove all players from the roster."""
+        self.teams.clear()
+        self.team_humans.clear()
+        self.humans.clear()
+        self.bots.clear()
+        self.bot_indexes.clear()
+        self.alive.clear()
+        self._player_teams.clear()
+        self._indexes.clear()
+
+# The singleton object of the _PlayerRoster class.
+player_roster = _PlayerRoster()
+
+
+# =============================================================================
+# >> GAME EVENTS
+# =============================================================================
+@Event('player_activate')
+def _player_activate(game_event):
+    """Add the player to the roster."""
+    player = Player.from_userid(game_event['userid'])
+    player_roster.add_player(
+        player.userid, player.index, player.team, player.is_fake_client(),
+    )
+
+
+@Event('player_team')
+def _player_team(game_event):
+    """Move the player to their new team."""
+    if game_event['disconnect']:
+        return
+    player_roster.set_team(game_event['userid'], game_event['team'])
+
+
+@Event('player_spawn')
+def _player_spawn(game_event):
+    """Mark the player as alive."""
+    player_roster.set_alive(game_event['userid'], True)
+
+
+@Event('player_death')
+def _player_death(game_event):
+    """Mark the player as dead."""
+    player_roster.set_alive(game_event['userid'], False)
+
+
+@Event('player_disconnect')
+def _player_disconnect(game_event):
+    """Remove the player from the roster."""
+    player_roster.remove_player(game_event['userid'])
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    """Clear the roster on map change."""
+    player_roster.clear()
@@ -0,0 +1,199 @@
+# ../gungame/core/plugins/breaker.py
+
+"""Circuit breaker for slow or failing sub-plugin callbacks."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from enum import IntEnum
+from time import perf_counter
+
+# Source.Python
+from hooks.exceptions import except_hooks
+from listeners.tick import Delay
+
+# GunGame
+from . import gg_plugins_logger
+from ..config.misc import (
+    plugin_breaker_action, plugin_strike_limit, plugin_time_limit,
+)
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'BreakerAction',
+    '_GuardedCallback',
+    '_PluginBreaker',
+    'gg_plugins_breaker_logger',
+    'plugin_breaker',
+)
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+gg_plugins_breaker_logger = gg_plugins_logger.breaker
+
+_plugin_module_prefix = 'gungame.plugins.'
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class BreakerAction(IntEnum):
+    """Actions taken when a sub-plugin callback trips the breaker."""
+
+    # Callbacks are not guarded
+    DISABLED = 0
+
+    # Only report the callback that tripped the breaker
+    REPORT = 1
+
+    # Stop calling the callback, if it can be disabled, or report it
+    DISABLE_CALLBACK = 2
+
+    # Unload the plugin that owns the callback
+    UNLOAD_PLUGIN = 3
+
+
+class _GuardedCallback(object):
+    """Wrapper that times a sub-plugin callback and counts its failures.
+
+    A call that raises an exception or takes longer than the time limit is
+    a strike, and a normal call clears the strikes.  Only the callback's
+    own time counts, not the time of guarded callbacks it causes to run.
+    Once the strike limit is reached in a row, the breaker is tripped.
+    Callbacks that keep state or can block events are never disabled, as
+    skipping them would leave the match in a broken state.  The wrapper
+    compares equal to the callback, so it can be unregistered with the
+    callback.
+    """
+
+    def __init__(self, callback, plugin_name, can_disable):
+        """Store the callback and the plugin it belongs to."""
+        self.callback = callback
+        self.plugin_name = plugin_name
+        self.can_disable = can_disable
+        self.strikes = 0
+        self.errors = 0
+        self.tripped = False
+
+    def __call__(self, *args, **kwargs):
+        """Call the callback and keep track of its time and errors."""
+        if self.tripped:
+            return None
+        plugin_breaker.start_call()
+        start = perf_counter()
+        try:
+            return_value = self.callback(*args, **kwargs)
+        except Exception:
+            plugin_breaker.end_call(perf_counter() - start)
+            except_hooks.print_exception()
+            self.errors += 1
+            self._add_strike('raised an exception')
+            return None
+        elapsed = plugin_breaker.end_call(perf_counter() - start) * 1000
+        limit = plugin_time_limit.float_value
+        if limit > 0 and elapsed > limit:
+            self._add_strike('took {elapsed:.2f}ms'.format(elapsed=elapsed))
+        else:
+            self.strikes = 0
+        return return_value
+
+    def __eq__(self, other):
+        """Return whether the other object is this wrapper's callback."""
+        if isinstance(other, _GuardedCallback):
+            return self.callback == other.callback
+        return self.callback == other
+
+    def __hash__(self):
+        """Return the hash of the callback."""
+        return hash(self.callback)
+
+    def _add_strike(self, reason):
+        """Add a strike and trip the breaker if the limit is reached."""
+        self.strikes += 1
+        if self.strikes < max(plugin_strike_limit.int_value, 1):
+            return
+        plugin_breaker.trip(self, reason)
+        self.strikes = 0
+
+
+class _PluginBreaker(object):
+    """Class used to guard sub-plugin callbacks and report tripped ones."""
+
+    def __init__(self):
+        """Create the dictionary used to store tripped callbacks."""
+        self.tripped = dict()
+        self._nested_times = list()
+
+    def start_call(self):
+        """Start counting the time of guarded calls inside this one."""
+        self._nested_times.append(0)
+
+    def end_call(self, elapsed):
+        """Return the call's own time, without its nested guarded calls."""
+        nested = self._nested_times.pop()
+        if self._nested_times:
+            self._nested_times[-1] += elapsed
+        return elapsed - nested
+
+    def guard(self, callback, can_disable=False):
+        """Return the callback wrapped if it belongs to a sub-plugin.
+
+        Only callbacks guarded with can_disable set to True are disabled
+        when the breaker trips.  Others are reported instead.
+        """
+        if isinstance(callback, _GuardedCallback):
+            return callback
+        if plugin_breaker_action.int_value == BreakerAction.DISABLED:
+            return callback
+        module = getattr(callback, '__module__', None) or ''
+        if not module.startswith(_plugin_module_prefix):
+            return callback
+        module_parts = module.split('.')
+        if len(module_parts) < 4:
+            return callback
+        return _GuardedCallback(callback, module_parts[3], can_disable)
+
+    def trip(self, guarded, reason):
+        """Report the tripped callback and take the configured action."""
+        callback = guarded.callback
+        callback_name = getattr(callback, '__qualname__', repr(callback))
+        self.tripped[callback_name] = guarded.plugin_name
+        action = plugin_breaker_action.int_value
+        if action == BreakerAction.DISABLE_CALLBACK and guarded.can_disable:
+            guarded.tripped = True
+            result = 'The callback has been disabled.'
+        elif action == BreakerAction.UNLOAD_PLUGIN:
+            result = 'Unloading the plugin.'
+        else:
+            result = 'The callback is still being called.'
+        gg_plugins_breaker_logger.log_message(
+            'Callback "{callback}" from plugin "{plugin}" {reason} on '
+            '{strikes} calls in a row ({errors} errors total). '
+            '{action}'.format(
+                callback=callback_name,
+                plugin=guarded.plugin_name,
+                reason=reason,
+                strikes=guarded.strikes,
+                errors=guarded.errors,
+                action=result,
+            )
+        )
+        if action == BreakerAction.UNLOAD_PLUGIN:
+            Delay(0, self._unload_plugin, (guarded.plugin_name, ))
+
+    @staticmethod
+    def _unload_plugin(plugin_name):
+        """Unload the plugin through the plugin queue."""
+        # Imported here as the queue imports the events, which use the breaker
+        from .queue import plugin_queue
+        if plugin_name in plugin_queue.manager:
+            plugin_queue['unload'].add(plugin_name)
+
+# The singleton object of the _PluginBreaker class.
+plugin_breaker = _PluginBreaker()
@@ -12,6 +12,7 @@ from translations.strings import LangStrings
 
 # GunGame
 from ..credits import gungame_credits
+from ..entity_budget import entity_budget
 from . import plugin_strings, gg_plugins_logger
 from .instance import GGLoadedPlugin
 from .manager import gg_plugin_manager
@@ -227,6 +228,18 @@ class _GGSubCommandManager(SubCommandManager):
         # Print the message
         self.logger.log_message(message + '=' * 61 + '\n\n')
 
+    def print_entities(self):
+        """Print the entities GunGame and its plugins are using."""
+        # Get header messages
+        message = '\n' + self.prefix + 'Entities:\n' + '=' * 61 + '\n\n'
+
+        # Add the usage of each owner
+        for line in entity_budget.get_usage_lines():
+            message += '\t' + line + '\n'
+
+        # Print the message
+        self.logger.log_message(message + '\n' + '=' * 61 + '\n\n')
+
     @staticmethod
     def restart_match():
         """Restart the match."""
@@ -277,6 +290,12 @@ def _gg_credits(command_info):
     gg_command_manager.print_credits()
 
 
+@gg_command_manager.server_sub_command(['entities'])
+@gg_command_manager.client_sub_command(['entities'])
+def _gg_entities(command_info):
+    gg_command_manager.print_entities()
+
+
 @gg_command_manager.server_sub_command(['restart'])
 @gg_command_manager.client_sub_command(['restart'], 'gungame.restart')
 def _gg_restart(command_info):
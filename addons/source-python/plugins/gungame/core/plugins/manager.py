@@ -72,7 +72,7 @@ class _GGPluginManager(PluginManager):
 
     @property
     def is_team_game(self):
-        return any(team_levels.values())
+        return team_levels.leader_level > 0
 
     def _remove_modules(self, plugin_name):
         """Remove a plugin and all its modules."""
@@ -0,0 +1,147 @@
+# ../gungame/core/scratch.py
+
+"""Tick scoped transient state functionality."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from math import ceil
+
+# Source.Python
+from engines.server import global_vars
+from listeners import OnLevelShutdown, on_tick_listener_manager
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'ScratchDict',
+    '_ScratchManager',
+    'scratch_manager',
+)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _ScratchManager(object):
+    """Class used to remove expired scratch entries with one tick listener.
+
+    Only stores that have entries are checked, and the tick listener is
+    only registered while there are any.
+    """
+
+    def __init__(self):
+        """Store the base values."""
+        self.current_tick = 0
+        self.stores = dict()
+        self._registered = False
+
+    def add_store(self, store):
+        """Check the store for expired entries on the following ticks."""
+        self.stores[id(store)] = store
+        if not self._registered:
+            on_tick_listener_manager.register_listener(self._tick)
+            self._registered = True
+
+    def clear(self):
+        """Remove all entries from all stores."""
+        for store in self.stores.values():
+            store.clear()
+        self.stores.clear()
+        self._unregister()
+
+    def _unregister(self):
+        """Stop running on ticks since no stores have entries."""
+        if self._registered:
+            on_tick_listener_manager.unregister_listener(self._tick)
+            self._registered = False
+
+    def _tick(self):
+        """Remove the expired entries from each store."""
+        self.current_tick += 1
+        for store in tuple(self.stores.values()):
+            store.remove_expired(self.current_tick)
+            if not store:
+                del self.stores[id(store)]
+        if not self.stores:
+            self._unregister()
+
+# The singleton object of the _ScratchManager class.
+scratch_manager = _ScratchManager()
+
+
+class ScratchDict(dict):
+    """Dictionary whose entries are removed after a number of ticks.
+
+    By default, entries are removed at the end of the tick they are set
+    on.  Setting an existing key again starts its time over.
+    """
+
+    def __init__(self, ticks=1, seconds=None):
+        """Store the number of ticks (or seconds) entries are kept."""
+        super().__init__()
+        self.ticks = ticks
+        self.seconds = seconds
+        self._expires = dict()
+
+    def __setitem__(self, key, value):
+        """Store the value and when it expires."""
+        super().__setitem__(key, value)
+        ticks = self.ticks
+        if self.seconds is not None:
+            ticks = ceil(self.seconds / global_vars.interval_per_tick)
+        self._expires[key] = scratch_manager.current_tick + max(ticks, 1)
+        scratch_manager.add_store(self)
+
+    def __delitem__(self, key):
+        """Remove the key and its expiration."""
+        super().__delitem__(key)
+        del self._expires[key]
+
+    def pop(self, key, *default):
+        """Remove the key and return its value."""
+        self._expires.pop(key, None)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        """Remove and return the last key and value."""
+        key, value = super().popitem()
+        del self._expires[key]
+        return key, value
+
+    def setdefault(self, key, default=None):
+        """Return the key's value, setting it to the default if needed."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        """Set each of the given keys and values."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        """Remove all entries."""
+        super().clear()
+        self._expires.clear()
+
+    def remove_expired(self, current_tick):
+        """Remove all entries that expire on or before the given tick."""
+        expired = [
+            key for key, expires in self._expires.items()
+            if expires <= current_tick
+        ]
+        for key in expired:
+            del self[key]
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    """Remove all scratch entries on map change."""
+    scratch_manager.clear()
@@ -9,7 +9,9 @@
 from importlib import import_module
 
 # Source.Python
+from cvars import ConVar
 from settings.player import PlayerSettings
+from settings.types import BoolSetting, IntegerSetting
 
 # GunGame
 from gungame.info import info
@@ -21,6 +23,8 @@ from gungame.core.plugins.valid import valid_plugins
 # >> ALL DECLARATION
 # =============================================================================
 __all__ = (
+    'get_default_setting',
+    'get_player_setting',
     'gungame_player_settings',
     'register_player_settings',
 )
@@ -32,6 +36,32 @@ __all__ = (
 gungame_player_settings = PlayerSettings(info.name, 'gg')
 
 
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def get_player_setting(setting, player):
+    """Return the player's value for the setting.
+
+    Bots cannot change their settings, so they get the default value
+    without the client ConVar and storage lookups.
+    """
+    if player.is_bot():
+        return get_default_setting(setting)
+    return setting.get_setting(player.index)
+
+
+def get_default_setting(setting):
+    """Return the default value of the setting."""
+    default = setting.default
+    if not isinstance(default, ConVar):
+        return default
+    if isinstance(setting, BoolSetting):
+        return default.get_bool()
+    if isinstance(setting, IntegerSetting):
+        return default.get_int()
+    return default.get_string()
+
+
 # =============================================================================
 # >> SUB-PLUGIN PLAYER SETTINGS REGISTRATION
 # =============================================================================
@@ -21,6 +21,7 @@ from paths import SOUND_PATH
 # GunGame
 from ..config.misc import sound_pack
 from ..paths import GUNGAME_SOUND_PACK_PATH
+from ..players.roster import player_roster
 
 
 # =============================================================================
@@ -299,6 +300,13 @@ class _SoundManager(defaultdict):
         :rtype: Sound
         """
         sound = self.get_sound(sound_name)
+
+        # Are all of the given users bots?
+        if users:
+            users = player_roster.get_human_indexes(users)
+            if not users:
+                return sound
+
         sound.play(*users)
         return sound
 
@@ -0,0 +1,308 @@
+# ../gungame/core/spawns.py
+
+"""Batched player spawn and level information functionality."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from collections import defaultdict
+
+# Source.Python
+from events import Event
+from hooks.exceptions import except_hooks
+from listeners import OnLevelShutdown, on_tick_listener_manager
+
+# GunGame
+from .config.misc import give_armor, give_defusers, spawn_protection
+from .entity_budget import entity_budget
+from .governor import load_governor
+from .leaders import leader_manager
+from .messages import message_manager
+from .players.dictionary import player_dictionary
+from .status import GunGameMatchStatus, GunGameStatus
+from .timers import timer_wheel
+from .weapons.manager import weapon_order_manager
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    '_SpawnPipeline',
+    'get_level_info',
+    'send_level_info',
+    'spawn_pipeline',
+)
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# The game_player_equip outputs for each gg_give_armor value
+_armor_outputs = {
+    1: 'item_kevlar 1',
+    2: 'item_assaultsuit 1',
+}
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _SpawnPipeline(list):
+    """Class used to batch the spawn output of players on the same tick.
+
+    Spawn protection and the level weapon are given when the event fires.
+    All players protected on a tick share one timer to remove it.  The
+    armor and level information are sent on the next tick, so the map's
+    game_player_equip entity is reused, and players with the same level
+    information get a single hint message.
+    """
+
+    def __init__(self):
+        """Store the base values."""
+        super().__init__()
+        self._registered = False
+        self._protect_delay = None
+
+    def add(self, player):
+        """Protect and equip the player, and store them for the next tick."""
+        self._give_spawn_protection(player)
+
+        # Give the player their new weapon
+        player.strip_weapons()
+        player.give_level_weapon()
+
+        # Give CTs defusers, if need be
+        if player.team == 3 and give_defusers.bool_value:
+            player.has_defuser = True
+
+        if player.userid in self:
+            return
+        if not self._registered:
+            on_tick_listener_manager.register_listener(self._tick)
+            self._registered = True
+        self.append(player.userid)
+
+    def clear(self):
+        """Remove all stored spawns without processing them."""
+        super().clear()
+        self._protect_delay = None
+        self._unregister()
+
+    def _unregister(self):
+        """Stop running on ticks since there are no spawns."""
+        if self._registered:
+            on_tick_listener_manager.unregister_listener(self._tick)
+            self._registered = False
+
+    def _tick(self):
+        """Process the spawns stored since the last tick."""
+        userids = tuple(self)
+        super().clear()
+        self._protect_delay = None
+        self._unregister()
+        with load_governor:
+            try:
+                self._process(userids)
+            except Exception:
+                except_hooks.print_exception()
+
+    def _process(self, userids):
+        """Give armor to the given players and send their level info."""
+        # Is GunGame active?
+        if GunGameStatus.MATCH is not GunGameMatchStatus.ACTIVE:
+            return
+
+        players = list()
+        for userid in userids:
+
+            # Use try/except to get the player's instance
+            try:
+                player = player_dictionary[userid]
+            except ValueError:
+                continue
+
+            # Verify that the player is on a team and still alive
+            if player.team < 2 or player.dead:
+                continue
+            players.append(player)
+
+        if not players:
+            return
+
+        # Give player armor, if necessary
+        armor_output = _armor_outputs.get(give_armor.int_value)
+        if armor_output is not None:
+            equip = entity_budget.get_helper('game_player_equip')
+            for player in players:
+                equip.add_output(
+                    armor_output, caller=player, activator=player,
+                )
+
+        send_level_info(*players)
+
+    def _give_spawn_protection(self, player):
+        """Protect the player with the tick's shared timer to remove it."""
+        delay = spawn_protection.float_value
+        if delay <= 0:
+            return
+        if self._protect_delay is None:
+            self._protect_delay = timer_wheel.schedule(
+                delay, self._end_spawn_protection,
+            )
+
+            # The timer is passed so players protected again keep protection
+            self._protect_delay.args = (self._protect_delay, list())
+        self._protect_delay.args[1].append(player)
+        player.give_spawn_protection(self._protect_delay)
+
+    @staticmethod
+    def _end_spawn_protection(protect_delay, players):
+        """Remove the spawn protection given with the timer."""
+        for player in players:
+            if player_dictionary.get(player.userid) is player:
+                player.remove_spawn_protection(protect_delay)
+
+# The singleton object of the _SpawnPipeline class.
+spawn_pipeline = _SpawnPipeline()
+
+
+# =============================================================================
+# >> GAME EVENTS
+# =============================================================================
+@Event('player_spawn')
+def _player_spawn(game_event):
+    """Equip the player and batch their output with the tick's spawns."""
+    # Is GunGame active?
+    if GunGameStatus.MATCH is not GunGameMatchStatus.ACTIVE:
+        return
+
+    # Use try/except to get the player's instance
+    try:
+        player = player_dictionary[game_event['userid']]
+    except ValueError:
+        return
+
+    # Verify that the player is on a team
+    if player.team < 2:
+        return
+
+    spawn_pipeline.add(player)
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    """Clear the stored spawns on map change."""
+    spawn_pipeline.clear()
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def send_level_info(*players):
+    """Send level information to the given players.
+
+    Players that share a language, level, kill count, and leader state
+    get the same text, so each distinct text is sent in one message.
+    """
+    recipients = defaultdict(list)
+    for player in players:
+        if player.is_bot():
+            continue
+        language = player.language
+        key = (
+            language, player.level, player.multi_kill,
+            _get_leader_state(player),
+        )
+        if key not in recipients:
+            recipients[key].append(get_level_info(player, language))
+        recipients[key].append(player.index)
+
+    for text, *indexes in recipients.values():
+        message_manager.hint_message(text, *indexes)
+
+
+def get_level_info(player, language=None):
+    """Return the level information text for the given player."""
+    # Get the player's language
+    if language is None:
+        language = player.language
+
+    # Get the player's current level information
+    text = message_manager['LevelInfo:Current:Level'].get_string(
+        language,
+        player=player,
+        total=weapon_order_manager.max_levels,
+    )
+
+    # Add the player's weapon information to the message
+    text += message_manager['LevelInfo:Current:Weapon'].get_string(
+        language,
+        player=player,
+    )
+
+    # Get the player's current level's multi_kill value
+    multi_kill = player.level_multi_kill
+
+    # If the multi_kill value is not 1, add the multi_kill to the message
+    if multi_kill > 1:
+        text += message_manager['LevelInfo:Current:Kills'].get_string(
+            language,
+            kills=player.multi_kill,
+            total=player.level_multi_kill,
+        ) + '\n'
+
+    # Get the player's leader state
+    leader_state = _get_leader_state(player)
+
+    # Are there no leaders?
+    if leader_state is None:
+
+        # Add the no leaders text to the message
+        text += message_manager['LevelInfo:Leaders:None'].get_string(language)
+
+    # Is the player not one of the current leaders?
+    elif not leader_state:
+
+        # Get the leader's level
+        leader_level = leader_manager.leader_level
+
+        # Add the current leader text to the message
+        text += message_manager['LevelInfo:Leaders:Level'].get_string(
+            language,
+            level=leader_level,
+            total=weapon_order_manager.max_levels,
+            weapon=weapon_order_manager.active[leader_level].weapon,
+        )
+
+    # Is the player the only current leader?
+    elif leader_state == 1:
+
+        # Add the current leader text to the message
+        text += message_manager[
+            'LevelInfo:Current:Leader'
+        ].get_string(language)
+
+    # Is the player one of multiple current leaders?
+    else:
+
+        # Add the amongst leaders text to the message
+        text += message_manager[
+            'LevelInfo:Leaders:Among'
+        ].get_string(language)
+
+    return text
+
+
+def _get_leader_state(player):
+    """Return the player's leader count (None with no leaders, 0 if not)."""
+    leader_count = leader_manager.leader_count
+    if not leader_count:
+        return None
+    if not leader_manager.is_leading(player.userid):
+        return 0
+    return leader_count
@@ -23,9 +23,77 @@ __all__ = (
 # >> CLASSES
 # =============================================================================
 class _TeamLevels(dict):
+    """Dictionary of team levels that keeps the team standings current.
+
+    The team order, leading teams and lead margin are updated each time a
+    team's level changes, so menus and plugins can use them directly.
+    """
+
+    def __init__(self):
+        """Store the base standings."""
+        super().__init__()
+        self.ordered = list()
+        self.leaders = frozenset()
+        self.leader_level = 0
+        self.second_level = None
+        self.lead_margin = 0
+
+    def __setitem__(self, team, level):
+        """Set the team's level and update the standings."""
+        super().__setitem__(team, level)
+        self._update_standings()
+
+    def __delitem__(self, team):
+        """Remove the team and update the standings."""
+        super().__delitem__(team)
+        self._update_standings()
+
     def clear(self):
+        """Reset all team levels to 0."""
         for x in self:
-            self[x] = 0
+            super().__setitem__(x, 0)
+        self._update_standings()
+
+    @property
+    def is_tied(self):
+        """Return whether all teams are tied."""
+        return len(self.leaders) == len(self)
+
+    def get_margin(self, team):
+        """Return how many levels the team is ahead of (or behind) others.
+
+        A positive value is the lead of a sole leading team, a negative
+        value is how far the team trails the leader, and 0 means the team
+        is tied for the lead.
+        """
+        if team not in self.leaders:
+            return self[team] - self.leader_level
+        return self.lead_margin
+
+    def _update_standings(self):
+        """Store the team order, leaders and lead margin."""
+        self.ordered = sorted(self, key=lambda team: (-self[team], team))
+        if not self.ordered:
+            self.leaders = frozenset()
+            self.leader_level = 0
+            self.second_level = None
+            self.lead_margin = 0
+            return
+        self.leader_level = self[self.ordered[0]]
+        self.leaders = frozenset(
+            team for team in self.ordered if self[team] == self.leader_level
+        )
+        self.second_level = next(
+            (
+                self[team] for team in self.ordered
+                if self[team] != self.leader_level
+            ),
+            None,
+        )
+        if len(self.leaders) > 1:
+            self.lead_margin = 0
+        else:
+            self.lead_margin = self.leader_level - (self.second_level or 0)
 
 
 # =============================================================================
@@ -0,0 +1,291 @@
+# ../gungame/core/timers.py
+
+"""Tick based timer wheel functionality."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from collections import defaultdict
+from math import ceil
+
+# Source.Python
+from engines.server import global_vars
+from events import Event
+from hooks.exceptions import except_hooks
+from listeners import OnLevelShutdown, on_tick_listener_manager
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'Timer',
+    '_TimerWheel',
+    'timer_wheel',
+)
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# The number of bits used for the slots of the first level
+_FIRST_LEVEL_BITS = 8
+
+# The number of bits used for the slots of each higher level
+_LEVEL_BITS = 6
+
+# The number of levels above the first
+_HIGHER_LEVELS = 3
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class Timer(object):
+    """Class used to represent a callback scheduled on the timer wheel."""
+
+    def __init__(self, wheel, callback, args, kwargs, owner):
+        """Store the callback and its arguments."""
+        self.wheel = wheel
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs
+        self.owner = owner
+        self.expires = 0
+        self._slot = None
+
+    @property
+    def running(self):
+        """Return whether the timer is still scheduled."""
+        return self._slot is not None
+
+    @property
+    def time_remaining(self):
+        """Return the number of seconds until the timer expires."""
+        if not self.running:
+            return None
+        return (
+            (self.expires - self.wheel.current_tick) *
+            global_vars.interval_per_tick
+        )
+
+    def cancel(self):
+        """Remove the timer from the wheel."""
+        self.wheel.cancel(self)
+
+    def reschedule(self, delay):
+        """Move the timer to expire after the given delay."""
+        self.wheel.reschedule(self, delay)
+
+    def execute(self):
+        """Call the callback."""
+        return self.callback(*self.args, **self.kwargs)
+
+
+class _TimerWheel(object):
+    """Class used to schedule callbacks by tick with a hierarchical wheel.
+
+    The first level has one slot per tick.  Each higher level has slots
+    that span a full turn of the level below, and its slots are moved
+    down a level when that level wraps around.  Timers too far away for
+    the highest level are stored separately until it wraps around.  Slots
+    are dictionaries, so timers that expire on the same tick are called
+    in the order they were added.
+    """
+
+    def __init__(self):
+        """Create the levels of the wheel."""
+        self.current_tick = 0
+        self.levels = [[dict() for _ in range(1 << _FIRST_LEVEL_BITS)]]
+        self.levels.extend(
+            [dict() for _ in range(1 << _LEVEL_BITS)]
+            for _ in range(_HIGHER_LEVELS)
+        )
+        self.overflow = dict()
+        self.owners = defaultdict(set)
+        self.pending = 0
+        self.scheduled = 0
+        self.fired = 0
+        self.cancelled = 0
+        self._registered = False
+
+    def __len__(self):
+        """Return the number of pending timers."""
+        return self.pending
+
+    def schedule(self, delay, callback, args=(), kwargs=None, owner=None):
+        """Call the callback after the given delay in seconds.
+
+        A delay of 0 calls the callback on the next tick.  If an owner is
+        given, the timer can be cancelled with all of that owner's timers
+        using cancel_owner.
+        """
+        if not callable(callback):
+            raise ValueError('Given callback is not callable.')
+        timer = Timer(
+            self, callback, tuple(args),
+            kwargs if kwargs is not None else dict(), owner,
+        )
+        self._add(timer, delay)
+        self.scheduled += 1
+        if owner is not None:
+            self.owners[owner].add(timer)
+        return timer
+
+    def cancel(self, timer):
+        """Remove the timer from the wheel, if it is still scheduled."""
+        if not timer.running:
+            return
+        self._remove(timer)
+        self._remove_owner(timer)
+        self.cancelled += 1
+
+    def reschedule(self, timer, delay):
+        """Move the timer to expire after the given delay."""
+        if timer.running:
+            self._remove(timer)
+        elif timer.owner is not None:
+            self.owners[timer.owner].add(timer)
+        self._add(timer, delay)
+
+    def cancel_owner(self, owner):
+        """Remove all timers of the given owner from the wheel."""
+        timers = self.owners.pop(owner, None)
+        if not timers:
+            return
+        for timer in timers:
+            self._remove(timer)
+        self.cancelled += len(timers)
+
+    def clear(self):
+        """Remove all timers from the wheel."""
+        for level in self.levels:
+            for slot in level:
+                self._clear_slot(slot)
+        self._clear_slot(self.overflow)
+        self.owners.clear()
+        self.cancelled += self.pending
+        self.pending = 0
+        self._unregister()
+
+    @staticmethod
+    def _clear_slot(slot):
+        """Remove all timers in the given slot."""
+        for timer in slot:
+            timer._slot = None
+        slot.clear()
+
+    def _add(self, timer, delay):
+        """Add the timer to the slot for its expiration tick."""
+        ticks = max(ceil(delay / global_vars.interval_per_tick), 1)
+        timer.expires = self.current_tick + ticks
+        self._insert(timer)
+        self.pending += 1
+        if not self._registered:
+            on_tick_listener_manager.register_listener(self._tick)
+            self._registered = True
+
+    def _insert(self, timer):
+        """Store the timer in the slot for the ticks until it expires."""
+        ticks = timer.expires - self.current_tick
+        bits = _FIRST_LEVEL_BITS
+        if ticks < 1 << bits:
+            slot = self.levels[0][timer.expires & ((1 << bits) - 1)]
+        else:
+            for level in self.levels[1:]:
+                if ticks < 1 << (bits + _LEVEL_BITS):
+                    slot = level[
+                        (timer.expires >> bits) & ((1 << _LEVEL_BITS) - 1)
+                    ]
+                    break
+                bits += _LEVEL_BITS
+            else:
+                slot = self.overflow
+        slot[timer] = None
+        timer._slot = slot
+
+    def _remove(self, timer):
+        """Remove the timer from its slot."""
+        del timer._slot[timer]
+        timer._slot = None
+        self.pending -= 1
+
+    def _remove_owner(self, timer):
+        """Remove the timer from its owner's timers."""
+        if timer.owner is None:
+            return
+        timers = self.owners.get(timer.owner)
+        if timers is None:
+            return
+        timers.discard(timer)
+        if not timers:
+            del self.owners[timer.owner]
+
+    def _unregister(self):
+        """Stop running on ticks since there are no timers."""
+        if self._registered:
+            on_tick_listener_manager.unregister_listener(self._tick)
+            self._registered = False
+
+    def _cascade(self):
+        """Move timers down from the higher levels that are due."""
+        bits = _FIRST_LEVEL_BITS
+        for level in self.levels[1:]:
+            if self.current_tick & ((1 << bits) - 1):
+                return
+            index = (self.current_tick >> bits) & ((1 << _LEVEL_BITS) - 1)
+            self._reinsert(level[index])
+            bits += _LEVEL_BITS
+        if not self.current_tick & ((1 << bits) - 1):
+            self._reinsert(self.overflow)
+
+    def _reinsert(self, slot):
+        """Store the slot's timers again based on their remaining ticks."""
+        timers = tuple(slot)
+        slot.clear()
+        for timer in timers:
+            self._insert(timer)
+
+    def _tick(self):
+        """Advance the wheel and call the callbacks of expired timers."""
+        self.current_tick += 1
+        self._cascade()
+        slot = self.levels[0][
+            self.current_tick & ((1 << _FIRST_LEVEL_BITS) - 1)
+        ]
+
+        # Remove each timer before calling it, so callbacks can cancel the
+        # other timers in the slot or schedule new ones
+        while slot:
+            timer = next(iter(slot))
+            self._remove(timer)
+            self._remove_owner(timer)
+            self.fired += 1
+            try:
+                timer.execute()
+            except Exception:
+                except_hooks.print_exception()
+        if not self.pending:
+            self._unregister()
+
+# The singleton object of the _TimerWheel class.
+timer_wheel = _TimerWheel()
+
+
+# =============================================================================
+# >> GAME EVENTS
+# =============================================================================
+@Event('player_disconnect')
+def _player_disconnect(game_event):
+    """Cancel all timers owned by the disconnecting player."""
+    timer_wheel.cancel_owner(game_event['userid'])
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    """Cancel all timers on map change."""
+    timer_wheel.clear()
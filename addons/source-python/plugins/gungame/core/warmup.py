@@ -12,7 +12,6 @@ from warnings import warn
 
 # Source.Python
 from engines.server import engine_server
-from filters.players import PlayerIter
 from listeners.tick import Repeat
 
 # GunGame
@@ -21,6 +20,7 @@ from .config.warmup import (
     players_reached, start_config, end_config,
 )
 from .messages import message_manager
+from .players.roster import player_roster
 from .sounds.manager import sound_manager
 from .status import GunGameMatchStatus, GunGameStatus
 from .weapons.groups import all_weapons, melee_weapons
@@ -41,9 +41,6 @@ __all__ = (
 # Get all possible warmup weapons
 _possible_weapons = all_weapons - melee_weapons
 
-# Get a generator for human players
-_human_no_spec = PlayerIter('human', ['spec', 'un'])
-
 
 # =============================================================================
 # >> CLASSES
@@ -171,7 +168,7 @@ class _WarmupManager(object):
             return
 
         # Has the player limit been reached?
-        if len(list(_human_no_spec)) > min_players.get_int():
+        if player_roster.active_human_count > min_players.get_int():
 
             # Get what to do when the player limit is reached
             current = players_reached.get_int()
@@ -51,6 +51,7 @@ class _WeaponOrderManager(dict):
         self.randomize = False
         self._delay = None
         self._print_delay = None
+        self._callbacks = list()
 
         # Create the default files
         create_default_weapon_orders()
@@ -99,6 +100,7 @@ class _WeaponOrderManager(dict):
         self._active = value
         if self.randomize:
             self[self._active].randomize_order()
+        self._call_callbacks()
         self.print_order()
 
     def set_randomize(self, value):
@@ -108,8 +110,27 @@ class _WeaponOrderManager(dict):
         self._randomize = value
         if value:
             self[self._active].randomize_order()
+        self._call_callbacks()
         self.restart_game()
 
+    def register_callback(self, callback):
+        """Call the callback each time the active weapon order is set."""
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def unregister_callback(self, callback):
+        """Stop calling the callback when the active order is set."""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def _call_callbacks(self):
+        """Call the callbacks registered for active order changes."""
+        for callback in list(self._callbacks):
+            try:
+                callback()
+            except Exception:
+                except_hooks.print_exception()
+
     def print_order(self):
         """Delay 1 tick to print the current weapon order."""
         # Cancel the delay if it is active
@@ -137,7 +137,7 @@ class _LevelWeapon(object):
     @property
     def multi_kill(self):
         """Return the multi_kill value for the level."""
-        override = multi_kill_override.get_int()
+        override = multi_kill_override.int_value
         if self.weapon in _multi_kill_weapons and override:
             return override
         return self._multi_kill
@@ -5,13 +5,16 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
+# Source.Python
 from entities.entity import Entity
 from events.custom import CustomEvent
 from events.variable import ShortVariable, StringVariable
 from events.resource import ResourceFile
-from listeners import OnEntitySpawned
 from players.entity import Player
 
+# GunGame
+from gungame.core.entity_spawns import OnClassSpawned
+
 
 # =============================================================================
 # >> CUSTOM EVENTS
@@ -28,17 +31,9 @@ resource_file.load_events()
 # =============================================================================
 # >> LISTENERS
 # =============================================================================
-@OnEntitySpawned
-def entity_spawned(base_entity):
-    try:
-        entity = Entity(base_entity.index)
-    # TODO: clarify this exception
-    except Exception:
-        return
-
-    if entity.classname != 'npc_grenade_frag':
-        return
-
+@OnClassSpawned('npc_grenade_frag')
+def frag_spawned(base_entity):
+    entity = Entity(base_entity.index)
     try:
         player = Player(entity.owner.index)
     # TODO: clarify this exception
@@ -13,7 +13,6 @@ from importlib import import_module
 from core import GAME_NAME
 from cvars.tags import sv_tags
 from engines.server import engine_server
-from filters.entities import EntityIter
 from listeners.tick import Delay
 from translations.strings import LangStrings
 
@@ -21,6 +20,7 @@ from translations.strings import LangStrings
 from .info import info
 from .core.commands import register_all_commands, unregister_all_commands
 from .core.config import load_all_configs
+from .core.entity_index import entity_index
 from .core.events.storage import gg_resource_list
 from .core.logger import gg_logger
 from .core.players.database import winners_database
@@ -228,7 +228,7 @@ def unload():
         )
     )
     current += 1
-    for entity in EntityIter('func_buyzone'):
+    for entity in entity_index.iter_entities('func_buyzone'):
         entity.enable()
 
     # Restart the match
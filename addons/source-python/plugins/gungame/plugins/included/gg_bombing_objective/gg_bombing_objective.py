@@ -63,13 +63,13 @@ def _bomb_exploded(game_event):
 def _get_levels_to_increase(player, reason):
     """Return the number of levels to increase the player."""
     if reason == 'defused':
-        base_levels = defused_levels.get_int()
-        skip_nade = defused_skip_nade.get_int()
-        skip_knife = defused_skip_knife.get_int()
+        base_levels = defused_levels.int_value
+        skip_nade = defused_skip_nade.int_value
+        skip_knife = defused_skip_knife.int_value
     elif reason == 'detonated':
-        base_levels = detonated_levels.get_int()
-        skip_nade = detonated_skip_nade.get_int()
-        skip_knife = detonated_skip_knife.get_int()
+        base_levels = detonated_levels.int_value
+        skip_nade = detonated_skip_nade.int_value
+        skip_knife = detonated_skip_knife.int_value
     else:
         raise ValueError(
             'Invalid reason given "{reason}".'.format(reason=reason)
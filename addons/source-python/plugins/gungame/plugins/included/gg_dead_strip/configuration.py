@@ -0,0 +1,29 @@
+# ../gungame/plugins/included/gg_dead_strip/configuration.py
+
+"""Creates the gg_dead_strip configuration."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# GunGame
+from gungame.core.config.manager import GunGameConfigManager
+
+# Plugin
+from .info import info
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    'batch_removal',
+)
+
+
+# =============================================================================
+# >> CONFIGURATION
+# =============================================================================
+with GunGameConfigManager(info.name) as _config:
+
+    with _config.cvar('batch_removal', 1) as batch_removal:
+        batch_removal.add_text()
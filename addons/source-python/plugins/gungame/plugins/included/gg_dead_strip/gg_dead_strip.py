@@ -5,21 +5,134 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
+# Python
+from collections import defaultdict
+
 # Source.Python
+from entities.helpers import index_from_pointer
+from entities.hooks import EntityCondition, EntityPreHook
 from events import Event
-from filters.weapons import WeaponIter
+from listeners import OnEntityDeleted, OnLevelShutdown
+from memory import make_object
+from players.entity import Player
+from weapons.entity import Weapon
 from weapons.manager import weapon_manager
 
+# GunGame
+from gungame.core.kills import KillStage
+from gungame.core.timers import timer_wheel
+
+# Plugin
+from .configuration import batch_removal
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the userid of the player that dropped each weapon index
+_dropped_weapons = dict()
+
+# Store the dropped weapon indexes of each player
+_player_drops = defaultdict(set)
+
+# Store the userids of players to strip on the next tick
+_pending_victims = set()
+
+# Weapons with these tags are never removed
+_skip_tags = {'tool', 'objective'}
+
+
+# =============================================================================
+# >> HOOKED FUNCTIONS
+# =============================================================================
+@EntityPreHook(EntityCondition.is_bot_player, 'drop_weapon')
+@EntityPreHook(EntityCondition.is_human_player, 'drop_weapon')
+def _pre_drop_weapon(stack_data):
+    """Store the weapon as dropped by the player."""
+    try:
+        index = index_from_pointer(stack_data[1])
+    except ValueError:
+        return
+
+    weapon = Weapon(index)
+    if weapon.classname not in weapon_manager:
+        return
+    if _skip_tags.intersection(weapon_manager[weapon.classname].tags):
+        return
+
+    _forget_weapon(index)
+    userid = make_object(Player, stack_data[0]).userid
+    _dropped_weapons[index] = userid
+    _player_drops[userid].add(index)
+
 
 # =============================================================================
 # >> GAME EVENTS
 # =============================================================================
-@Event('player_death')
-def _strip_weapons(game_event):
-    for weapon in WeaponIter(
-        not_filters=(
-            tag for tag in ('tool', 'objective') if tag in weapon_manager.tags
-        )
-    ):
+@KillStage()
+def _strip_weapons(context):
+    """Remove the weapons dropped by the victim."""
+    if not batch_removal.bool_value:
+        _remove_dropped_weapons(context.userid)
+        return
+    if not _pending_victims:
+        timer_wheel.schedule(0, _remove_pending)
+    _pending_victims.add(context.userid)
+
+
+@Event('player_disconnect')
+def _player_disconnect(game_event):
+    """Stop tracking the weapons dropped by the player."""
+    for index in _player_drops.pop(game_event['userid'], ()):
+        del _dropped_weapons[index]
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnEntityDeleted
+def _entity_deleted(base_entity):
+    """Stop tracking the weapon if it was dropped."""
+    try:
+        index = base_entity.index
+    except ValueError:
+        return
+    _forget_weapon(index)
+
+
+@OnLevelShutdown
+def _level_shutdown():
+    """Clear the tracked weapons on map change."""
+    _dropped_weapons.clear()
+    _player_drops.clear()
+    _pending_victims.clear()
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _forget_weapon(index):
+    """Stop tracking the given weapon index."""
+    userid = _dropped_weapons.pop(index, None)
+    if userid is None:
+        return
+    indexes = _player_drops[userid]
+    indexes.discard(index)
+    if not indexes:
+        del _player_drops[userid]
+
+
+def _remove_pending():
+    """Remove the weapons dropped by all players that died on the tick."""
+    for userid in tuple(_pending_victims):
+        _remove_dropped_weapons(userid)
+    _pending_victims.clear()
+
+
+def _remove_dropped_weapons(userid):
+    """Remove the player's dropped weapons that no one has picked up."""
+    for index in tuple(_player_drops.pop(userid, ())):
+        del _dropped_weapons[index]
+        weapon = Weapon(index)
         if weapon.owner is None:
             weapon.remove()
@@ -17,6 +17,7 @@ from .info import info
 # =============================================================================
 __all__ = (
     'delay',
+    'smart_spawns',
 )
 
 
@@ -26,3 +27,6 @@ __all__ = (
 with GunGameConfigManager(info.name) as _config:
     with _config.cvar('delay', 2) as delay:
         delay.add_text()
+
+    with _config.cvar('smart_spawns', 1) as smart_spawns:
+        smart_spawns.add_text()
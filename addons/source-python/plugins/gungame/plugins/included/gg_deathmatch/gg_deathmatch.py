@@ -15,10 +15,12 @@ from players.entity import Player
 from players.helpers import userid_from_index
 
 # GunGame
+from gungame.core.kills import KillStage
 from gungame.core.players.dictionary import player_dictionary
 
 # Plugin
-from .configuration import delay
+from .configuration import delay, smart_spawns
+from .planner import spawn_planner
 
 
 # =============================================================================
@@ -34,7 +36,7 @@ class DMPlayer(Player):
 
     def start_repeat(self):
         """Start the player's respawn countdown."""
-        self.repeat.start(1, max(delay.get_int(), 1))
+        self.repeat.start(1, max(delay.int_value, 1))
 
     def _countdown(self):
         """Send messages about impending respawn and respawns the player."""
@@ -44,6 +46,14 @@ class DMPlayer(Player):
             # No need to respawn them
             return
 
+        # Bots do not need the countdown messages
+        if self.is_bot():
+
+            # Respawn the bot once its countdown is finished
+            if not self.repeat.loops_remaining:
+                self.respawn()
+            return
+
         # Does the player's repeat have more loops remaining?
         if self.repeat.loops_remaining:
 
@@ -62,6 +72,13 @@ class DMPlayer(Player):
             )
 
             # Respawn the player
+            self.respawn()
+
+    def respawn(self):
+        """Respawn the player at the best point or let the game choose."""
+        if smart_spawns.bool_value:
+            spawn_planner.add(self.userid)
+        else:
             self.spawn()
 
     def stop_repeat(self):
@@ -162,20 +179,16 @@ def _player_spawn(game_event):
     player = deathmatch_players[userid]
 
     # Is the player a bot?
-    if player.is_fake_client():
+    if player.is_bot():
 
         # Start the player's repeat
         player.start_repeat()
 
 
-@Event('player_death')
-def _player_death(game_event):
+@KillStage()
+def _player_death(context):
     """Start the player's repeat when they are killed."""
-    # Get the player's userid
-    userid = game_event['userid']
-
-    # Start the player's repeat
-    deathmatch_players[userid].start_repeat()
+    deathmatch_players[context.userid].start_repeat()
 
 
 @Event('player_disconnect')
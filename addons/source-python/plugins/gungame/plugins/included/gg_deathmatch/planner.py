@@ -0,0 +1,303 @@
+# ../gungame/plugins/included/gg_deathmatch/planner.py
+
+"""Chooses respawn points away from enemies."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python
+from math import inf
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Source.Python
+from cvars import cvar
+from filters.entities import EntityIter
+from filters.players import PlayerIter
+from hooks.exceptions import except_hooks
+from listeners import OnLevelShutdown, on_tick_listener_manager
+from players.entity import Player
+
+# GunGame
+from gungame.core.governor import load_governor
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = (
+    '_SpawnPlanner',
+    'spawn_planner',
+)
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# The spawn point classnames for each team
+_team_class_names = {
+    2: 'info_player_terrorist',
+    3: 'info_player_counterterrorist',
+}
+
+# The spawn point classnames used by players without a team, and by all
+# players on maps without team spawn points
+_shared_class_names = ('info_player_deathmatch', 'info_player_start')
+
+# The distance within which a spawn point is considered taken
+_OCCUPIED_DISTANCE = 64
+
+# The cosine of half of an enemy's view cone
+_VIEW_CONE = 0.5
+
+# The multiplier for the distance of points an enemy is looking towards
+_VIEW_FACTOR = 0.5
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _SpawnPlanner(list):
+    """Class used to respawn all players of a tick at the safest points.
+
+    The spawn points of each team are stored on the first respawn of each
+    map.  Each point is scored by its distance to the closest living
+    enemy, and that distance is halved when the enemy is looking towards
+    the point.  Points near living players or points already chosen this
+    tick for any team are not used.  When NumPy is available, all points
+    are scored at once for each team.
+    Players without a team treat all other living players as enemies, and
+    any player that cannot be placed is spawned by the game.
+    """
+
+    def __init__(self):
+        """Store the base values."""
+        super().__init__()
+        self.points = dict()
+        self.shared_points = list()
+        self._built = False
+        self._registered = False
+
+    def add(self, userid):
+        """Add the player to be respawned on the next tick."""
+        if userid in self:
+            return
+        if not self._registered:
+            on_tick_listener_manager.register_listener(self._tick)
+            self._registered = True
+        self.append(userid)
+
+    def clear(self):
+        """Remove all stored players and spawn points."""
+        super().clear()
+        self.points.clear()
+        self.shared_points = list()
+        self._built = False
+        self._unregister()
+
+    def build(self):
+        """Store the spawn points of each team and the shared points."""
+        self.points = dict()
+        for team, class_name in _team_class_names.items():
+            origins = [entity.origin for entity in EntityIter(class_name)]
+            if origins:
+                self.points[team] = origins
+        self.shared_points = [
+            entity.origin for class_name in _shared_class_names
+            for entity in EntityIter(class_name)
+        ]
+        if not self.shared_points:
+            self.shared_points = [
+                origin for origins in self.points.values()
+                for origin in origins
+            ]
+        self._built = True
+
+    def get_points(self, team):
+        """Return the spawn points for players on the given team."""
+        return self.points.get(team) or self.shared_points
+
+    def _unregister(self):
+        """Stop running on ticks since there are no players."""
+        if self._registered:
+            on_tick_listener_manager.unregister_listener(self._tick)
+            self._registered = False
+
+    def _tick(self):
+        """Respawn the players stored since the last tick."""
+        userids = tuple(self)
+        super().clear()
+        self._unregister()
+        with load_governor:
+            try:
+                self._process(userids)
+            except Exception:
+                except_hooks.print_exception()
+                self._spawn_remaining(userids)
+
+    @staticmethod
+    def _spawn_remaining(userids):
+        """Let the engine spawn the players that are still dead."""
+        for userid in userids:
+            try:
+                player = Player.from_userid(userid)
+            except ValueError:
+                continue
+            if player.dead:
+                player.spawn()
+
+    def _process(self, userids):
+        """Respawn the given players at the best points for their team."""
+        # Store the map's spawn points once they exist
+        if not self._built:
+            self.build()
+
+        teams = dict()
+        for userid in userids:
+            try:
+                player = Player.from_userid(userid)
+            except ValueError:
+                continue
+            if not player.dead:
+                continue
+
+            # Let the engine handle spectators, as it did before
+            if player.team == 1:
+                player.spawn()
+                continue
+            teams.setdefault(player.team, []).append(player)
+
+        if not teams:
+            return
+
+        living = list(PlayerIter('alive'))
+        occupied = [player.origin for player in living]
+        threats = [
+            (player.team, player.eye_location, player.view_vector)
+            for player in living
+        ]
+        all_enemies = _teammates_are_enemies()
+        for team, players in teams.items():
+            origins = self.get_points(team)
+            enemies = [
+                (location, view) for other, location, view in threats
+                if all_enemies or team < 2 or other != team
+            ]
+
+            # Let the engine choose if there is nothing to plan around
+            if not origins or not enemies:
+                for player in players:
+                    player.spawn()
+                continue
+
+            if numpy is not None:
+                self._respawn_numpy(players, origins, enemies, occupied)
+            else:
+                self._respawn_python(players, origins, enemies, occupied)
+
+    @staticmethod
+    def _respawn_numpy(players, origins, enemies, occupied):
+        """Score the team's points together using NumPy arrays."""
+        points = _get_array(origins)
+        locations = _get_array(location for location, view in enemies)
+        views = _get_array(view for location, view in enemies)
+
+        # Get the distance from each point to each enemy
+        offsets = points[:, None, :] - locations[None, :, :]
+        distances = numpy.sqrt((offsets ** 2).sum(axis=2))
+
+        # Shorten the distance of points the enemies are looking towards
+        facing = (offsets * views[None, :, :]).sum(axis=2)
+        distances = numpy.where(
+            facing > distances * _VIEW_CONE,
+            distances * _VIEW_FACTOR, distances,
+        )
+        scores = distances.min(axis=1)
+
+        # Remove the points that are near living players
+        offsets = points[:, None, :] - _get_array(occupied)[None, :, :]
+        scores[
+            ((offsets ** 2).sum(axis=2) < _OCCUPIED_DISTANCE ** 2).any(axis=1)
+        ] = -inf
+
+        for player in players:
+            index = int(scores.argmax())
+            if scores[index] == -inf:
+                player.spawn()
+                continue
+            player.spawn()
+            player.teleport(origins[index])
+            occupied.append(origins[index])
+
+            # Remove the points near the chosen one
+            offsets = points - points[index]
+            scores[
+                (offsets ** 2).sum(axis=1) < _OCCUPIED_DISTANCE ** 2
+            ] = -inf
+
+    @staticmethod
+    def _respawn_python(players, origins, enemies, occupied):
+        """Score the team's points one at a time."""
+        scores = list()
+        for origin in origins:
+            if any(
+                origin.get_distance(location) < _OCCUPIED_DISTANCE
+                for location in occupied
+            ):
+                scores.append(-inf)
+                continue
+            score = inf
+            for location, view in enemies:
+                offset = origin - location
+                distance = offset.length
+                if offset.dot(view) > distance * _VIEW_CONE:
+                    distance *= _VIEW_FACTOR
+                score = min(score, distance)
+            scores.append(score)
+
+        for player in players:
+            score = max(scores)
+            if score == -inf:
+                player.spawn()
+                continue
+            index = scores.index(score)
+            player.spawn()
+            player.teleport(origins[index])
+            occupied.append(origins[index])
+
+            # Remove the points near the chosen one
+            for other, origin in enumerate(origins):
+                if (
+                    origin.get_distance(origins[index]) <
+                    _OCCUPIED_DISTANCE
+                ):
+                    scores[other] = -inf
+
+# The singleton object of the _SpawnPlanner class.
+spawn_planner = _SpawnPlanner()
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _teammates_are_enemies():
+    """Return whether the game treats teammates as enemies."""
+    convar = cvar.find_var('mp_teammates_are_enemies')
+    return convar is not None and convar.get_bool()
+
+
+def _get_array(vectors):
+    """Return a NumPy array with a row for each of the given vectors."""
+    return numpy.array([(vector.x, vector.y, vector.z) for vector in vectors])
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    """Clear the stored players and spawn points on map change."""
+    spawn_planner.clear()
@@ -10,9 +10,11 @@ from enum import IntEnum
 
 # Source.Python
 from events import Event
-from filters.entities import EntityIter
-from filters.weapons import WeaponIter
 from players.entity import Player
+from weapons.entity import Weapon
+
+# GunGame
+from gungame.core.entity_index import entity_index
 
 # Plugin
 from .configuration import disable_type
@@ -39,13 +41,13 @@ def load():
 def unload():
     """Re-enable all objectives."""
     # Loop through all bomb targets
-    for entity in EntityIter('func_bomb_target'):
+    for entity in entity_index.iter_entities('func_bomb_target'):
 
         # Enable the bomb target
         entity.enable()
 
     # Loop through all rescue zones
-    for entity in EntityIter('func_hostage_rescue'):
+    for entity in entity_index.iter_entities('func_hostage_rescue'):
 
         # Enable the rescue zone
         entity.enable()
@@ -58,19 +60,22 @@ def unload():
 def _disable_objectives(game_event=None):
     """Disable objectives each round."""
     # Get the objectives to disable
-    objectives = disable_type.get_int()
+    objectives = disable_type.int_value
 
     # Do bombing objectives need removed?
     if objectives & ObjectiveType.BOMBING:
 
         # Loop through all bomb targets
-        for entity in EntityIter('func_bomb_target'):
+        for entity in entity_index.iter_entities('func_bomb_target'):
 
             # Disable the bomb target
             entity.disable()
 
         # Loop through all c4 entities
-        for weapon in WeaponIter('objective'):
+        for index in tuple(entity_index['weapon_c4']):
+
+            # Get the weapon's instance
+            weapon = Weapon(index)
 
             # Get the entity's owner
             owner = weapon.owner
@@ -88,13 +93,13 @@ def _disable_objectives(game_event=None):
     if objectives & ObjectiveType.HOSTAGE:
 
         # Loop through all rescue zones
-        for entity in EntityIter('func_hostage_rescue'):
+        for entity in entity_index.iter_entities('func_hostage_rescue'):
 
             # Disable the rescue zone
             entity.disable()
 
         # Loop through all hostage entities
-        for entity in EntityIter('hostage_entity'):
+        for entity in entity_index.iter_entities('hostage_entity'):
 
             # Remove the entity from the server
             entity.remove()
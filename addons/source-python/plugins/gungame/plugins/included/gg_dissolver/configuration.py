@@ -22,6 +22,7 @@ __all__ = (
     'dissolver_delay',
     'dissolver_type',
     'magnitude',
+    'per_tick',
 )
 
 
@@ -51,3 +52,6 @@ with GunGameConfigManager(info.name) as _config:
 
     with _config.cvar('delay') as dissolver_delay:
         dissolver_delay.add_text()
+
+    with _config.cvar('per_tick', 4, min_value=1) as per_tick:
+        per_tick.add_text()
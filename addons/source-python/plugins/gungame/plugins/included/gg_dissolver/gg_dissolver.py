@@ -6,6 +6,7 @@
 # >> IMPORTS
 # =============================================================================
 # Python
+from collections import defaultdict
 from random import randrange
 from warnings import warn
 
@@ -13,12 +14,20 @@ from warnings import warn
 from entities.constants import DissolveType, INVALID_ENTITY_INTHANDLE
 from entities.entity import Entity
 from entities.helpers import index_from_inthandle
-from events import Event
-from listeners.tick import Delay
+from hooks.exceptions import except_hooks
+from listeners import OnLevelShutdown, on_tick_listener_manager
 from players.entity import Player
 
+# GunGame
+from gungame.core.entity_budget import entity_budget
+from gungame.core.governor import load_governor
+from gungame.core.kills import KillStage
+from gungame.core.timers import timer_wheel
+
 # Plugin
-from .configuration import dissolver_delay, dissolver_type, magnitude
+from .configuration import (
+    dissolver_delay, dissolver_type, magnitude, per_tick,
+)
 
 
 # =============================================================================
@@ -27,14 +36,114 @@ from .configuration import dissolver_delay, dissolver_type, magnitude
 _num_dissolve_types = len(DissolveType.__members__)
 
 
+# =============================================================================
+# >> LOAD & UNLOAD
+# =============================================================================
+def unload():
+    """Remove all queued ragdolls."""
+    dissolve_batch.clear()
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _DissolveBatch(list):
+    """Class used to dissolve queued ragdolls together on each tick.
+
+    Only gg_dissolver_per_tick ragdolls are handled each tick, and the
+    rest wait for the following ticks.  Ragdolls of the same dissolve type
+    are given one target name, so the map's dissolver is configured and
+    fired once for each type in the batch.
+    """
+
+    def __init__(self):
+        """Store the base values."""
+        super().__init__()
+        self.batch_count = 0
+        self._registered = False
+
+    def add(self, userid, current_type):
+        """Add the player's ragdoll to be dissolved."""
+        if not self._registered:
+            on_tick_listener_manager.register_listener(self._tick)
+            self._registered = True
+        self.append((userid, current_type))
+
+    def clear(self):
+        """Remove all queued ragdolls without dissolving them."""
+        super().clear()
+        self._unregister()
+
+    def _unregister(self):
+        """Stop running on ticks since there are no ragdolls."""
+        if self._registered:
+            on_tick_listener_manager.unregister_listener(self._tick)
+            self._registered = False
+
+    def _tick(self):
+        """Dissolve the next ragdolls in the queue."""
+        count = max(1, per_tick.int_value)
+        entries = self[:count]
+        del self[:count]
+        if not self:
+            self._unregister()
+        with load_governor:
+            try:
+                self._dissolve(entries)
+            except Exception:
+                except_hooks.print_exception()
+
+    def _dissolve(self, entries):
+        """Remove or dissolve the ragdolls of the given players."""
+        ragdolls = defaultdict(list)
+        for userid, current_type in entries:
+            entity = _get_ragdoll(userid)
+            if entity is None:
+                continue
+
+            # Should the ragdoll just be removed?
+            if current_type == _num_dissolve_types + 2:
+                entity.remove()
+                continue
+
+            # Should a random dissolve type be chosen?
+            if current_type == _num_dissolve_types + 1:
+                current_type = randrange(_num_dissolve_types)
+            ragdolls[current_type].append(entity)
+
+        if not ragdolls:
+            return
+
+        # Get the dissolver entity and set the magnitude
+        dissolver_entity = entity_budget.get_helper(
+            'env_entity_dissolver', 'gg_dissolver',
+        )
+        dissolver_entity.magnitude = magnitude.int_value
+
+        for current_type, entities in ragdolls.items():
+
+            # Set the same target name for all ragdolls of the type
+            self.batch_count += 1
+            target_name = 'gg_dissolve_{count}'.format(count=self.batch_count)
+            for entity in entities:
+                entity.target_name = target_name
+
+            # Dissolve the ragdolls
+            dissolver_entity.dissolve_type = current_type
+            dissolver_entity.dissolve(target_name)
+
+# The singleton object of the _DissolveBatch class.
+dissolve_batch = _DissolveBatch()
+
+
 # =============================================================================
 # >> GAME EVENTS
 # =============================================================================
-@Event('player_death')
-def dissolve_player_ragdoll(game_event):
+@KillStage()
+def dissolve_player_ragdoll(context):
     """Dissolve/remove the player's ragdoll on death."""
     # Get the type of dissolver to use
-    current_type = dissolver_type.get_int()
+    current_type = dissolver_type.int_value
 
     # Is the type valid?
     if current_type < 0 or current_type > _num_dissolve_types + 2:
@@ -50,50 +159,43 @@ def dissolve_player_ragdoll(game_event):
         # Use the remove setting
         current_type = _num_dissolve_types + 2
 
+    # Are effects being skipped due to server load?
+    # Ragdolls are still removed, since that frees their entities
+    if (
+        load_governor.skip_effects and
+        current_type != _num_dissolve_types + 2
+    ):
+        return
+
     # Delay the dissolving
-    Delay(
-        max(0, dissolver_delay.get_int()),
-        dissolve_ragdoll,
-        (game_event['userid'], current_type),
+    timer_wheel.schedule(
+        max(0, dissolver_delay.int_value),
+        dissolve_batch.add,
+        (context.userid, current_type),
+        owner=context.userid,
     )
 
 
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    """Remove all queued ragdolls on map change."""
+    dissolve_batch.clear()
+
+
 # =============================================================================
 # >> HELPER FUNCTIONS
 # =============================================================================
-def dissolve_ragdoll(userid, current_type):
-    """Dissolve/remove the player's ragdoll."""
-    # Get the ragdoll entity
+def _get_ragdoll(userid):
+    """Return the player's ragdoll entity, if it exists."""
     try:
         inthandle = Player.from_userid(userid).ragdoll
     # TODO: clarify this exception
     except Exception:
-        return
+        return None
 
     if inthandle == INVALID_ENTITY_INTHANDLE:
-        return
-    entity = Entity(index_from_inthandle(inthandle))
-
-    # Should the ragdoll just be removed?
-    if current_type == _num_dissolve_types + 2:
-        entity.remove()
-        return
-
-    # Set the target name for the player's ragdoll
-    entity.target_name = 'ragdoll_{userid}'.format(userid=userid)
-
-    # Get the dissolver entity
-    dissolver_entity = Entity.find_or_create('env_entity_dissolver')
-
-    # Should a random dissolve type be chosen?
-    if current_type == _num_dissolve_types + 1:
-        current_type = randrange(_num_dissolve_types)
-
-    # Set the magnitude
-    dissolver_entity.magnitude = magnitude.get_int()
-
-    # Set the dissolve type
-    dissolver_entity.dissolve_type = current_type
-
-    # Dissolve the ragdoll
-    dissolver_entity.dissolve('ragdoll_{userid}'.format(userid=userid))
+        return None
+    return Entity(index_from_inthandle(inthandle))
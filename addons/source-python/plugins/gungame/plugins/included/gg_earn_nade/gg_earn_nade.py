@@ -5,13 +5,11 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
-# Source.Python
-from events import Event
-from listeners.tick import Delay
-
 # GunGame
+from gungame.core.kills import KillStage, KillType
 from gungame.core.players.attributes import AttributePreHook
-from gungame.core.players.dictionary import player_dictionary
+from gungame.core.scratch import ScratchDict
+from gungame.core.settings import get_player_setting
 from gungame.core.weapons.groups import all_grenade_weapons
 
 # Plugin
@@ -22,32 +20,23 @@ from .settings import auto_switch
 # >> GLOBAL VARIABLES
 # =============================================================================
 # Store a dictionary to know when a player recently leveled from knife level
-_recently_off_nade = dict()
+_recently_off_nade = ScratchDict()
 
 
 # =============================================================================
 # >> GAME EVENTS
 # =============================================================================
-@Event('player_death')
-def _earn_nade(game_event):
-    userid = game_event['userid']
-    attacker = game_event['attacker']
-    if attacker in (userid, 0):
-        return
-
-    victim = player_dictionary[userid]
-    killer = player_dictionary[attacker]
-    if victim.team == killer.team:
-        return
-
+@KillStage(kill_types=KillType.ENEMY)
+def _earn_nade(context):
+    killer = context.killer
     if killer.level_weapon not in all_grenade_weapons:
         return
 
-    if attacker in _recently_off_nade:
+    if context.attacker in _recently_off_nade:
         return
 
     weapon = killer.give_level_weapon()
-    if auto_switch.get_setting(killer.index):
+    if get_player_setting(auto_switch, killer):
         killer.equip_weapon(weapon)
 
 
@@ -64,4 +53,3 @@ def _pre_level_change(player, attribute, new_value):
         'level': player.level,
         'weapon': player.level_weapon
     }
-    Delay(0, _recently_off_nade.__delitem__, args=(player.userid, ))
@@ -11,12 +11,13 @@ from operator import attrgetter
 
 # Source.Python
 from events import Event
-from listeners.tick import Delay
 
 # GunGame
+from gungame.core.kills import KillStage
 from gungame.core.status import GunGameRoundStatus, GunGameStatus
 from gungame.core.messages import message_manager
 from gungame.core.players.dictionary import player_dictionary
+from gungame.core.timers import timer_wheel
 
 
 # =============================================================================
@@ -28,21 +29,26 @@ eliminated_players = defaultdict(set)
 # =============================================================================
 # >> GAME EVENTS
 # =============================================================================
-@Event('player_death')
-def _player_death(game_event):
+@KillStage()
+def _player_death(context):
     """Respawn any players the victim killed."""
     if GunGameStatus.ROUND is GunGameRoundStatus.INACTIVE:
         return
-    victim = player_dictionary[game_event['userid']]
-    Delay(0, _respawn_victims, args=(victim.userid, ))
-    attacker = game_event['attacker']
-    if attacker in (victim.userid, 0):
-        Delay(5, _respawn_player, args=(victim.userid, ))
+    victim = context.victim
+    timer_wheel.schedule(0, _respawn_victims, args=(victim.userid, ))
+    if context.is_suicide:
+        timer_wheel.schedule(
+            5, _respawn_player, args=(victim.userid, ), owner=victim.userid,
+        )
         victim.chat_message('Elimination:Suicide')
         return
-    killer = player_dictionary[attacker]
-    if victim.team == killer.team:
-        Delay(5, _respawn_player, args=(victim.userid, ))
+    killer = context.killer
+    if killer is None:
+        return
+    if context.is_team_kill:
+        timer_wheel.schedule(
+            5, _respawn_player, args=(victim.userid, ), owner=victim.userid,
+        )
         victim.chat_message('Elimination:TeamKill')
         return
     # TODO: Test reconnecting to see if players are not respawned
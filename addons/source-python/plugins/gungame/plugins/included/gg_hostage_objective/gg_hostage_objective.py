@@ -5,11 +5,18 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
+# Python
+from collections import defaultdict
+
 # Source.Python
+from entities.constants import INVALID_ENTITY_INTHANDLE
 from events import Event
-from filters.entities import EntityIter
+from listeners import OnLevelShutdown
+from players.helpers import userid_from_inthandle
 
 # GunGame
+from gungame.core.entity_index import entity_index
+from gungame.core.kills import KillStage
 from gungame.core.players.attributes import player_attributes
 from gungame.core.players.dictionary import player_dictionary
 from gungame.core.weapons.groups import all_grenade_weapons, melee_weapons
@@ -23,14 +30,25 @@ from .configuration import (
 )
 
 
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the indexes of the hostages following each player
+_hostage_followers = defaultdict(set)
+
+# Store the userid of the player each hostage index is following
+_hostage_leaders = dict()
+
+
 # =============================================================================
 # >> LOAD & UNLOAD
 # =============================================================================
 def load():
-    """Add the player hostage attributes."""
+    """Add the player hostage attributes and find current followers."""
     player_attributes.register_attribute('hostage_rescues', 0)
     player_attributes.register_attribute('hostage_stops', 0)
     player_attributes.register_attribute('hostage_kills', 0)
+    _find_followers()
 
 
 def unload():
@@ -43,12 +61,38 @@ def unload():
 # =============================================================================
 # >> GAME EVENTS
 # =============================================================================
+@Event('hostage_follows')
+def _hostage_follows(game_event):
+    """Store the hostage as following the player."""
+    _add_follower(game_event['userid'], game_event['hostage'])
+
+
+@Event('hostage_stops_following')
+def _hostage_stops_following(game_event):
+    """Remove the hostage from its leader's followers."""
+    _remove_follower(game_event['hostage'])
+
+
+@Event('round_start')
+def _round_start(game_event):
+    """Clear the followers since the hostages are respawned."""
+    _hostage_followers.clear()
+    _hostage_leaders.clear()
+
+
+@Event('player_disconnect')
+def _player_disconnect(game_event):
+    """Remove the player's followers."""
+    _remove_leader(game_event['userid'])
+
+
 @Event('hostage_rescued')
 def _hostage_rescued(game_event):
     """Level the rescuer up."""
+    _remove_follower(game_event['hostage'])
     player = player_dictionary[game_event['userid']]
     player.hostage_rescues += 1
-    required = rescued_count.get_int()
+    required = rescued_count.int_value
     if player.hostage_rescues < required:
         return
     player.hostage_rescues = 0
@@ -66,24 +110,15 @@ def _hostage_rescued(game_event):
     )
 
 
-@Event('player_death')
-def _player_death(game_event):
+@KillStage()
+def _player_death(context):
     """Level the stopper up."""
-    victim = player_dictionary[game_event['userid']]
-    hostages = len([
-        entity for entity in EntityIter('hostage_entity')
-        if entity.leader == victim.inthandle
-    ])
-    if not hostages:
-        return
-    attacker = game_event['attacker']
-    if not attacker:
-        return
-    player = player_dictionary[attacker]
-    if player.team == victim.team:
+    hostages = _remove_leader(context.userid)
+    if not hostages or not context.is_enemy_kill:
         return
+    player = context.killer
     player.hostage_stops += hostages
-    required = stopped_count.get_int()
+    required = stopped_count.int_value
     if player.hostage_stops < required:
         return
     player.hostage_stops -= required
@@ -104,8 +139,9 @@ def _player_death(game_event):
 @Event('hostage_killed')
 def _hostage_killed(game_event):
     """Level the killer down."""
-    levels = killed_levels.get_int()
-    min_count = killed_count.get_int()
+    _remove_follower(game_event['hostage'])
+    levels = killed_levels.int_value
+    min_count = killed_count.int_value
     if levels < 1 or min_count < 1:
         return
     attacker = game_event['attacker']
@@ -129,19 +165,69 @@ def _hostage_killed(game_event):
         )
 
 
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    """Clear the followers on map change."""
+    _hostage_followers.clear()
+    _hostage_leaders.clear()
+
+
 # =============================================================================
 # >> HELPER FUNCTIONS
 # =============================================================================
+def _find_followers():
+    """Store the hostages that are already following players."""
+    _hostage_followers.clear()
+    _hostage_leaders.clear()
+    for entity in entity_index.iter_entities('hostage_entity'):
+        if entity.leader == INVALID_ENTITY_INTHANDLE:
+            continue
+        try:
+            userid = userid_from_inthandle(entity.leader)
+        except (OverflowError, ValueError):
+            continue
+        _add_follower(userid, entity.index)
+
+
+def _add_follower(userid, hostage):
+    """Store the hostage as following the player."""
+    _remove_follower(hostage)
+    _hostage_followers[userid].add(hostage)
+    _hostage_leaders[hostage] = userid
+
+
+def _remove_follower(hostage):
+    """Remove the hostage from its leader's followers."""
+    userid = _hostage_leaders.pop(hostage, None)
+    if userid is None:
+        return
+    hostages = _hostage_followers[userid]
+    hostages.discard(hostage)
+    if not hostages:
+        del _hostage_followers[userid]
+
+
+def _remove_leader(userid):
+    """Remove the player's followers and return how many there were."""
+    hostages = _hostage_followers.pop(userid, ())
+    for hostage in hostages:
+        del _hostage_leaders[hostage]
+    return len(hostages)
+
+
 def _get_levels_to_increase(player, reason):
     """Return the number of levels to increase the player."""
     if reason == 'rescued':
-        base_levels = rescued_levels.get_int()
-        skip_nade = rescued_skip_nade.get_int()
-        skip_knife = rescued_skip_knife.get_int()
+        base_levels = rescued_levels.int_value
+        skip_nade = rescued_skip_nade.int_value
+        skip_knife = rescued_skip_knife.int_value
     elif reason == 'stopped':
-        base_levels = stopped_levels.get_int()
-        skip_nade = stopped_skip_nade.get_int()
-        skip_knife = stopped_skip_knife.get_int()
+        base_levels = stopped_levels.int_value
+        skip_nade = stopped_skip_nade.int_value
+        skip_knife = stopped_skip_knife.int_value
     else:
         raise ValueError(
             'Invalid reason given "{reason}".'.format(reason=reason)
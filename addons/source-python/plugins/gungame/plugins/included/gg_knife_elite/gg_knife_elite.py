@@ -5,16 +5,14 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
-# Source.Python
-from events import Event
-
 # GunGame
+from gungame.core.events.bus import GGEvent
 from gungame.core.players.dictionary import player_dictionary
 
 
 # =============================================================================
 # >> GUNGAME EVENTS
 # =============================================================================
-@Event('gg_level_up')
+@GGEvent('gg_level_up')
 def _strip_weapons(game_event):
     player_dictionary[game_event['leveler']].strip_weapons(strip_grenades=True)
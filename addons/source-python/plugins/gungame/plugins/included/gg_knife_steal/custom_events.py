@@ -6,10 +6,10 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events.custom import CustomEvent
 from events.variable import ByteVariable, ShortVariable
 
 # GunGame
+from gungame.core.events.bus import GunGameEvent
 from gungame.core.events.resource import GGResourceFile
 
 # Plugin
@@ -27,7 +27,7 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class GG_Knife_Steal(CustomEvent):
+class GG_Knife_Steal(GunGameEvent):
     """Called when a player steals a level by knifing."""
 
     attacker = leveler = ShortVariable(
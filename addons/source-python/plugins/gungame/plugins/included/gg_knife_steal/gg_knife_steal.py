@@ -6,13 +6,16 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events import Event
-from listeners.tick import Delay
 from weapons.manager import weapon_manager
 
 # GunGame
+from gungame.core.events.bus import GGEvent
+from gungame.core.kills import KillStage, KillType
 from gungame.core.players.attributes import AttributePreHook
 from gungame.core.players.dictionary import player_dictionary
+from gungame.core.scratch import ScratchDict
+from gungame.core.settings import get_player_setting
+from gungame.core.timers import timer_wheel
 
 # Plugin
 from .configuration import (
@@ -26,7 +29,7 @@ from .settings import auto_switch
 # >> GLOBAL VARIABLES
 # =============================================================================
 # Store a dictionary to know when a player recently leveled from knife level
-_recently_off_knife = dict()
+_recently_off_knife = ScratchDict()
 _knife_classnames = {
     x.name for x in weapon_manager.values() if x.basename in knife_weapons
 }
@@ -35,21 +38,13 @@ _knife_classnames = {
 # =============================================================================
 # >> GAME EVENTS
 # =============================================================================
-@Event('player_death')
-def _steal_level(game_event):
+@KillStage(kill_types=KillType.ENEMY, weapons='knife')
+def _steal_level(context):
     """Level up the killer and down the victim on knife kills."""
-    if game_event['weapon'] != 'knife':
-        return
-
-    attacker = game_event['attacker']
-    userid = game_event['userid']
-    if attacker in (userid, 0):
-        return
-
-    killer = player_dictionary[attacker]
-    victim = player_dictionary[userid]
-    if killer.team == victim.team:
-        return
+    attacker = context.attacker
+    userid = context.userid
+    killer = context.killer
+    victim = context.victim
 
     if attacker in _recently_off_knife:
         weapon = _recently_off_knife[attacker]['weapon']
@@ -63,20 +58,20 @@ def _steal_level(game_event):
 
     victim_level = victim.level
 
-    current = limit.get_int()
+    current = limit.int_value
     difference = killer_level - victim_level
     if current and difference > current:
         killer.chat_message('KnifeSteal:Difference', levels=difference)
         return
 
-    if victim_level == 1 and not level_one_victim.get_bool():
+    if victim_level == 1 and not level_one_victim.bool_value:
         killer.chat_message('KnifeSteal:LevelOne')
         return
 
     if weapon in grenade_weapons:
-        if not grenade_weapons[weapon]['skip'].get_bool():
+        if not grenade_weapons[weapon]['skip'].bool_value:
             killer.chat_message('KnifeSteal:NoSkip', weapon=weapon)
-            if grenade_weapons[weapon]['level'].get_bool():
+            if grenade_weapons[weapon]['level'].bool_value:
                 victim.decrease_level(
                     levels=1,
                     reason='steal',
@@ -85,7 +80,7 @@ def _steal_level(game_event):
             return
 
     if weapon in knife_weapons:
-        if knife_weapons[weapon].get_bool():
+        if knife_weapons[weapon].bool_value:
             victim.decrease_level(
                 levels=1,
                 reason='steal',
@@ -116,11 +111,13 @@ def _steal_level(game_event):
 # =============================================================================
 # >> GUNGAME EVENTS
 # =============================================================================
-@Event('gg_knife_steal')
+@GGEvent('gg_knife_steal')
 def _on_knife_steal(game_event):
     attacker = player_dictionary[game_event['leveler']]
-    if auto_switch.get_setting(attacker.index):
-        Delay(0, _set_back_to_knife, (attacker.userid, ))
+    if get_player_setting(auto_switch, attacker):
+        timer_wheel.schedule(
+            0, _set_back_to_knife, (attacker.userid, ), owner=attacker.userid,
+        )
 
 
 # =============================================================================
@@ -136,7 +133,6 @@ def _pre_level_change(player, attribute, new_value):
         'level': player.level,
         'weapon': player.level_weapon
     }
-    Delay(0, _recently_off_knife.__delitem__, args=(player.userid, ))
 
 
 # =============================================================================
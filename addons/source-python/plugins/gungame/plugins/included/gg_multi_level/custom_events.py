@@ -6,10 +6,10 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events.custom import CustomEvent
 from events.variable import ShortVariable
 
 # GunGame
+from gungame.core.events.bus import GunGameEvent
 from gungame.core.events.resource import GGResourceFile
 
 # Plugin
@@ -27,7 +27,7 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class GG_Multi_Level(CustomEvent):
+class GG_Multi_Level(GunGameEvent):
     """Called when a player achieves a multi-level bonus."""
 
     userid = leveler = ShortVariable(
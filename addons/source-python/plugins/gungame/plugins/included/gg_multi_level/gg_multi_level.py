@@ -5,20 +5,23 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
-# Python
-from time import time
-
 # Source.Python
-from entities.entity import Entity
 from events import Event
-from listeners import on_tick_listener_manager
+from listeners import OnLevelShutdown
 from mathlib import Vector
 from players.entity import Player
 
 # GunGame
+from gungame.core.config.manager import ConVarChanged
+from gungame.core.cosmetics import CosmeticPriority, cosmetic_queue
+from gungame.core.entity_budget import entity_budget
+from gungame.core.events.bus import GGEvent
+from gungame.core.governor import load_governor
+from gungame.core.kills import KillStage
 from gungame.core.players.attributes import player_attributes
 from gungame.core.players.dictionary import player_dictionary
 from gungame.core.sounds.manager import sound_manager
+from gungame.core.timers import timer_wheel
 
 # Plugin
 from .configuration import (
@@ -35,6 +38,7 @@ def load():
 
 
 def unload():
+    multi_level_manager.clear()
     player_attributes.unregister_attribute('multi_levels')
 
 
@@ -44,20 +48,39 @@ def unload():
 class _MultiLevelPlayer(Player):
     """"""
 
+    sound = None
     spark_entity = None
+    expire_timer = None
 
     def __init__(self, index):
         super(_MultiLevelPlayer, self).__init__(index)
-        self.sound = sound_manager.emit_sound('multi_level', index)
         self.start_gravity = self.gravity
         self.start_speed = self.speed
-        self.gravity = gravity.get_int() / 100
-        self.speed = speed.get_int() / 100
-        self.end_time = time() + length.get_float()
-        self.give_spark_entity()
+        self.apply_effects()
+        cosmetic_queue.add(
+            self.start_effects,
+            priority=CosmeticPriority.LOW,
+            userid=self.userid,
+        )
+
+    def apply_effects(self):
+        """Set the player's multi-level gravity and speed."""
+        self.gravity = gravity.int_value / 100
+        self.speed = speed.int_value / 100
+
+    def start_effects(self):
+        if multi_level_manager.get(self.userid) is not self:
+            return
+        if not load_governor.drop_sounds:
+            self.sound = sound_manager.emit_sound('multi_level', self.index)
+        if not load_governor.skip_effects:
+            self.give_spark_entity()
 
     def give_spark_entity(self):
-        entity = self.spark_entity = Entity.create('env_spark')
+        entity = entity_budget.create('env_spark', 'gg_multi_level')
+        if entity is None:
+            return
+        self.spark_entity = entity
         entity.spawn_flags = 896
         entity.angles = Vector(-90, 0, 0)
         entity.magnitude = 8
@@ -69,46 +92,63 @@ class _MultiLevelPlayer(Player):
     def remove_multi_level(self):
         self.gravity = self.start_gravity
         self.speed = self.start_speed
-        self.sound.stop(self.index)
+        if self.sound is not None:
+            self.sound.stop(self.index)
         self.remove_spark_entity()
 
     def remove_spark_entity(self):
-        self.spark_entity.stop_spark()
-        self.spark_entity.remove()
+        if self.spark_entity is None:
+            return
+        entity = self.spark_entity
+        self.spark_entity = None
+        entity.stop_spark()
+        entity.clear_parent()
+        entity_budget.release(entity)
 
 
 class _MultiLevelManager(dict):
-    """"""
+    """Class used to store the players that currently have multi-level.
+
+    Each multi-level ends with a timer on the shared timer wheel, so
+    nothing runs on the ticks in between.  Gravity and speed are only
+    set again when the player spawns or one of the cvars changes.
+    """
 
     def __delitem__(self, userid):
         if userid not in self:
             return
-        self[userid].remove_multi_level()
+        player = self[userid]
+        if player.expire_timer is not None:
+            player.expire_timer.cancel()
+        player.remove_multi_level()
         super(_MultiLevelManager, self).__delitem__(userid)
-        if not len(self):
-            on_tick_listener_manager.unregister_listener(self._tick)
 
     def clear(self):
         for userid in list(self):
             del self[userid]
 
+    def reset(self):
+        """Remove all players without restoring them on map change."""
+        for player in self.values():
+            if player.expire_timer is not None:
+                player.expire_timer.cancel()
+        super(_MultiLevelManager, self).clear()
+
     def give_multi_level(self, userid):
-        if not len(self):
-            on_tick_listener_manager.register_listener(self._tick)
         if userid in self:
             del self[userid]
-        self[userid] = _MultiLevelPlayer.from_userid(userid)
+        player = self[userid] = _MultiLevelPlayer.from_userid(userid)
+        player.expire_timer = timer_wheel.schedule(
+            length.float_value, self.__delitem__, (userid, ), owner=userid,
+        )
         with GG_Multi_Level() as event:
             event.userid = userid
             event.leveler = userid
 
-    def _tick(self):
-        current_gravity = gravity.get_int()
-        for userid, player in list(self.items()):
-            if player.end_time <= time():
-                del self[userid]
-                continue
-            player.gravity = current_gravity
+    def apply_effects(self):
+        """Set the gravity and speed of all multi-level players."""
+        for player in self.values():
+            player.apply_effects()
 
 multi_level_manager = _MultiLevelManager()
 
@@ -116,11 +156,11 @@ multi_level_manager = _MultiLevelManager()
 # =============================================================================
 # >> GUNGAME EVENTS
 # =============================================================================
-@Event('gg_level_up')
+@GGEvent('gg_level_up')
 def _player_level_up(game_event):
     player = player_dictionary[game_event['leveler']]
     player.multi_levels += 1
-    if player.multi_levels >= levels.get_int():
+    if player.multi_levels >= levels.int_value:
         # Give or increase multi-level
         multi_level_manager.give_multi_level(player.userid)
 
@@ -128,30 +168,48 @@ def _player_level_up(game_event):
 # =============================================================================
 # >> GAME EVENTS
 # =============================================================================
-@Event('player_death')
-def _reset_team_killers(game_event):
-    userid = game_event['userid']
-    attacker = game_event['attacker']
-
-    # Suicide?
-    if attacker in (0, userid):
-        del multi_level_manager[userid]
-        return
+@KillStage()
+def _reset_team_killers(context):
+    userid = context.userid
+    attacker = context.attacker
 
     # Not team-kill?
-    if Player.from_userid(userid).team != Player.from_userid(attacker).team:
+    if not context.is_team_kill:
         del multi_level_manager[userid]
         return
 
     # Reset team-kill victim's multi-level?
-    if not tk_victim_reset.get_bool():
+    if not tk_victim_reset.bool_value:
         del multi_level_manager[userid]
 
     # Reset the team-killer's multi-level?
-    if tk_attacker_reset.get_bool():
+    if tk_attacker_reset.bool_value:
         del multi_level_manager[attacker]
 
 
+@Event('player_spawn')
+def _reapply_effects(game_event):
+    player = multi_level_manager.get(game_event['userid'])
+    if player is not None:
+        player.apply_effects()
+
+
 @Event('player_disconnect')
 def _remove_disconnecting_player(game_event):
     del multi_level_manager[game_event['userid']]
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+@OnLevelShutdown
+def _level_shutdown():
+    multi_level_manager.reset()
+
+
+# =============================================================================
+# >> CONVAR CHANGE CALLBACKS
+# =============================================================================
+@ConVarChanged(gravity, speed)
+def _effects_changed(convar):
+    multi_level_manager.apply_effects()
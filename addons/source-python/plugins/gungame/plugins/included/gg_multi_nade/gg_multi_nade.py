@@ -10,11 +10,14 @@ from collections import defaultdict
 
 # Source.Python
 from events import Event
-from listeners.tick import Delay
 
 # GunGame
+from gungame.core.events.bus import GGEvent
+from gungame.core.events.conditional import ConditionalEvent
 from gungame.core.players.dictionary import player_dictionary
+from gungame.core.timers import timer_wheel
 from gungame.core.weapons.groups import all_grenade_weapons
+from gungame.core.weapons.manager import weapon_order_manager
 
 # Plugin
 from .configuration import max_nades
@@ -26,10 +29,36 @@ from .configuration import max_nades
 _nade_count = defaultdict(int)
 
 
+# =============================================================================
+# >> LOAD & UNLOAD
+# =============================================================================
+def load():
+    weapon_order_manager.register_callback(_weapon_fire.update)
+
+
+def unload():
+    weapon_order_manager.unregister_callback(_weapon_fire.update)
+
+
 # =============================================================================
 # >> GAME EVENTS
 # =============================================================================
-@Event('weapon_fire')
+def _order_has_grenades():
+    """Return whether the active weapon order has any grenade levels."""
+    try:
+        weapon_order = weapon_order_manager.active
+    except KeyError:
+        return False
+    return any(
+        level_weapon.weapon in all_grenade_weapons
+        for level_weapon in weapon_order.values()
+    )
+
+
+_weapon_fire = ConditionalEvent('weapon_fire', condition=_order_has_grenades)
+
+
+@_weapon_fire
 def delay_give_new_weapon(game_event):
     weapon = game_event['weapon']
     if weapon not in all_grenade_weapons:
@@ -45,19 +74,31 @@ def delay_give_new_weapon(game_event):
         return
 
     _nade_count[player.userid] += 1
-    value = max_nades.get_int()
+    value = max_nades.int_value
     if not value or _nade_count[player.userid] < value:
         # TODO: adjust this delay value
-        Delay(1, give_new_weapon, (player.userid, weapon))
+        timer_wheel.schedule(
+            1, give_new_weapon, (player.userid, weapon), owner=player.userid,
+        )
 
 
-@Event('player_spawn', 'gg_level_up')
+@Event('player_spawn')
 def reset_player_count(game_event):
     userid = game_event['userid']
     if userid in _nade_count:
         del _nade_count[userid]
 
 
+# =============================================================================
+# >> GUNGAME EVENTS
+# =============================================================================
+@GGEvent('gg_level_up')
+def _reset_leveler_count(game_event):
+    userid = game_event['leveler']
+    if userid in _nade_count:
+        del _nade_count[userid]
+
+
 # =============================================================================
 # >> HELPER FUNCTIONS
 # =============================================================================
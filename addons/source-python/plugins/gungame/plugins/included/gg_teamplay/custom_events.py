@@ -6,10 +6,10 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events.custom import CustomEvent
 from events.variable import ByteVariable, ShortVariable, StringVariable
 
 # GunGame
+from gungame.core.events.bus import GunGameEvent
 from gungame.core.events.resource import GGResourceFile
 
 # Plugin
@@ -28,7 +28,7 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class GG_Team_Level_Up(CustomEvent):
+class GG_Team_Level_Up(GunGameEvent):
     """Called during team-based play when a team levels up."""
 
     team = ShortVariable('The team that leveled up')
@@ -37,7 +37,7 @@ class GG_Team_Level_Up(CustomEvent):
     style = StringVariable('The style of teamplay match')
 
 
-class GG_Team_Win(CustomEvent):
+class GG_Team_Win(GunGameEvent):
     """Called during team-based play when a team wins the match."""
 
     winner = ShortVariable('The team that won the match')
@@ -5,12 +5,9 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
-# Source.Python
-from events import Event
-
 # GunGame
 from gungame.core.config.weapon import prop_physics
-from gungame.core.players.dictionary import player_dictionary
+from gungame.core.kills import KillStage, KillType
 from gungame.core.rules.strings import rules_translations
 from gungame.core.weapons.groups import grenade_weapons, melee_weapons
 
@@ -38,29 +35,21 @@ for _key, _value in rules_translations.items():
 # =============================================================================
 # >> GAME EVENTS
 # =============================================================================
-@Event('player_death')
-def _increment_team_multi_kill(game_event):
-    attacker = player_dictionary.get(game_event['attacker'])
-    if attacker is None:
-        return
-
-    victim = player_dictionary[game_event['userid']]
-    if victim.team == attacker.team:
-        return
-
-    team = team_dictionary.get(attacker.team)
+@KillStage(kill_types=KillType.ENEMY)
+def _increment_team_multi_kill(context):
+    team = team_dictionary.get(context.killer.team)
     if team is None:
         return
 
-    weapon = game_event['weapon']
+    weapon = context.weapon
     if weapon != team.level_weapon:
-        if weapon == 'prop_physics' and not prop_physics.get_int():
+        if weapon == 'prop_physics' and not prop_physics.int_value:
             return
 
-        elif weapon in melee_weapons and not count_melee_kills.get_int():
+        elif weapon in melee_weapons and not count_melee_kills.int_value:
             return
 
-        elif weapon in grenade_weapons and not count_grenade_kills.get_int():
+        elif weapon in grenade_weapons and not count_grenade_kills.int_value:
             return
 
     team.increase_multi_kill()
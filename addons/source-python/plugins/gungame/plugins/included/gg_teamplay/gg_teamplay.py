@@ -11,12 +11,12 @@ import sys
 
 # Source.Python
 from core import AutoUnload, GAME_NAME, WeakAutoUnload
-from events import Event
-from events.hooks import PreEvent, EventAction
+from events.hooks import EventAction
 from hooks.exceptions import except_hooks
 from listeners.tick import Delay
 
 # GunGame
+from gungame.core.events.bus import GGEvent, GGPreEvent
 from gungame.core.plugins.manager import gg_plugin_manager
 from gungame.core.teams import team_levels
 from gungame.core.weapons.manager import weapon_order_manager
@@ -97,7 +97,7 @@ _teamplay_manager = _TeamplayManager()
 # =============================================================================
 # >> GUNGAME EVENTS
 # =============================================================================
-@Event('gg_plugin_loaded', 'gg_plugin_unloaded')
+@GGEvent('gg_plugin_loaded', 'gg_plugin_unloaded')
 def _swap_style(game_event):
     if game_event['plugin'] != 'gg_deathmatch':
         return
@@ -121,6 +121,6 @@ def _swap_style(game_event):
 # =============================================================================
 # >> EVENT HOOKS
 # =============================================================================
-@PreEvent('gg_level_up')
+@GGPreEvent('gg_level_up')
 def _block_level_up(game_event):
     return EventAction.BLOCK
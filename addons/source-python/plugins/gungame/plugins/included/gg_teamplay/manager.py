@@ -8,14 +8,15 @@
 # Source.Python
 from colors import BLUE, RED, WHITE
 from cvars import ConVar
-from entities.entity import Entity
 from events import Event
 from listeners.tick import Delay
 
 # GunGame
 from gungame.core.config.misc import dynamic_chat_time
+from gungame.core.entity_budget import entity_budget
+from gungame.core.events.bus import GGEvent
 from gungame.core.messages import message_manager
-from gungame.core.players.dictionary import player_dictionary
+from gungame.core.players.roster import player_roster
 from gungame.core.sounds.manager import sound_manager
 from gungame.core.status import GunGameMatchStatus, GunGameStatus
 from gungame.core.teams import team_levels, team_names
@@ -43,10 +44,7 @@ class _TeamManager(object):
 
     @property
     def index(self):
-        for player in player_dictionary.values():
-            if player.team == self.team_number:
-                return player.index
-        return 0
+        return player_roster.get_team_index(self.team_number)
 
     @property
     def level_multi_kill(self):
@@ -65,9 +63,7 @@ class _TeamManager(object):
 
         # TODO: add melee/nade conditionals
 
-        return len(
-            [x for x in player_dictionary if x.team == self.team_number]
-        )
+        return player_roster.get_team_count(self.team_number)
 
     def increase_multi_kill(self):
         self.multi_kill += 1
@@ -102,12 +98,12 @@ class _TeamManager(object):
             event.style = _teamplay_manager.current_module
 
     def send_multi_kill_message(self):
-        current_level = self.level
         other_team = team_dictionary[5 - self.team_number]
+        margin = team_levels.get_margin(self.team_number)
         message = 'TeamPlay:MultiKill:'
-        if current_level > other_team.level:
+        if margin > 0:
             message += 'Leading'
-        elif current_level < other_team.level:
+        elif margin < 0:
             message += 'Trailing'
         else:
             message += 'Tied'
@@ -115,27 +111,26 @@ class _TeamManager(object):
             message=message,
             index=self.index,
             team=self,
-            other=other_team,
-            levels=abs(current_level - other_team.level)
+            other_team=other_team,
+            levels=abs(margin),
         )
 
     def send_level_up_message(self, old_level):
-        current_level = self.level
-        other_level = team_dictionary[5 - self.team_number].level
+        margin = team_levels.get_margin(self.team_number)
         message = 'TeamPlay:Level:'
-        if other_level < old_level:
-            message += 'Increase'
-        elif other_level > current_level:
+        if margin < 0:
             message += 'Trailing'
-        elif old_level == current_level:
+        elif not margin:
             message += 'Tied'
+        elif old_level > (team_levels.second_level or 0):
+            message += 'Increase'
         else:
             message += 'TakeLead'
         message_manager.chat_message(
             message=message,
             index=self.index,
             team=self,
-            levels=abs(current_level - other_level),
+            levels=abs(margin),
         )
 
     def send_current_level_message(self):
@@ -163,14 +158,14 @@ def _send_level_info(game_event):
 # =============================================================================
 # >> GUNGAME EVENTS
 # =============================================================================
-@Event('gg_team_level_up')
+@GGEvent('gg_team_level_up')
 def _handle_level_up(game_event):
     team_dictionary[game_event['team']].send_level_up_message(
         game_event['old_level']
     )
 
 
-@Event('gg_team_win')
+@GGEvent('gg_team_win')
 def _handle_team_win(game_event):
     # Set the match status
     GunGameStatus.MATCH = GunGameMatchStatus.POST
@@ -204,9 +199,9 @@ def _handle_team_win(game_event):
     winner_sound = sound_manager.play_sound('winner')
 
     # Set the dynamic chat time, if needed
-    if dynamic_chat_time.get_bool():
+    if dynamic_chat_time.bool_value:
         ConVar('mp_chattime').set_float(winner_sound.duration)
 
     # End the match to move to the next map
-    entity = Entity.find_or_create('game_end')
+    entity = entity_budget.get_helper('game_end', 'gg_teamplay')
     entity.end_game()
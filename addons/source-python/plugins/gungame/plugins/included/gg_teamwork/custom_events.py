@@ -6,10 +6,10 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python
-from events.custom import CustomEvent
 from events.variable import ShortVariable
 
 # GunGame
+from gungame.core.events.bus import GunGameEvent
 from gungame.core.events.resource import GGResourceFile
 
 # Plugin
@@ -27,7 +27,7 @@ __all__ = (
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class GG_Team_Win(CustomEvent):
+class GG_Team_Win(GunGameEvent):
     """Called during team-based play when a team wins the match."""
 
     winner = ShortVariable('The team that won the match')
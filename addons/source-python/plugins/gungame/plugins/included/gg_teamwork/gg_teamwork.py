@@ -8,16 +8,20 @@
 # Source.Python
 from colors import BLUE, RED, WHITE
 from cvars import ConVar
-from entities.entity import Entity
 from events import Event
-from events.hooks import EventAction, PreEvent
+from events.hooks import EventAction
+from filters.players import PlayerIter
 from listeners import OnLevelInit
 from listeners.tick import Delay
 from players.teams import teams_by_number
 
 # GunGame
 from gungame.core.config.misc import dynamic_chat_time
+from gungame.core.entity_budget import entity_budget
+from gungame.core.events.bus import GGEvent, GGPreEvent
+from gungame.core.leaders import LevelBuckets
 from gungame.core.messages import message_manager
+from gungame.core.players.attributes import AttributePostHook
 from gungame.core.players.dictionary import player_dictionary
 from gungame.core.sounds.manager import sound_manager
 from gungame.core.status import GunGameMatchStatus, GunGameStatus
@@ -34,6 +38,7 @@ from .custom_events import GG_Team_Win
 # =============================================================================
 def load():
     message_manager.hook_prefix('Leader:')
+    teamwork_manager.add_current_players()
 
 
 def unload():
@@ -44,10 +49,39 @@ def unload():
 # >> CLASSES
 # =============================================================================
 class _TeamManager(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.player_teams = dict()
+
     def clear(self):
+        self.player_teams.clear()
         for team_number in self:
             self[team_number].reset_values()
 
+    def add_current_players(self):
+        for player in PlayerIter():
+            self.add_player(player_dictionary[player.userid], player.team)
+
+    def add_player(self, player, team_number):
+        self.remove_player(player.userid)
+        if team_number not in self:
+            return
+        self.player_teams[player.userid] = team_number
+        self[team_number].player_levels[player.userid] = player.level
+
+    def remove_player(self, userid):
+        team_number = self.player_teams.pop(userid, None)
+        if team_number is not None:
+            del self[team_number].player_levels[userid]
+
+    def get_player_team(self, userid):
+        return self.get(self.player_teams.get(userid))
+
+    def set_player_level(self, userid, level):
+        team_number = self.player_teams.get(userid)
+        if team_number is not None:
+            self[team_number].player_levels[userid] = level
+
 
 class _TeamManagement(object):
 
@@ -58,6 +92,7 @@ class _TeamManagement(object):
         self.name = team_names[self.number]
         self._leader = None
         self.leader_userid = None
+        self.player_levels = LevelBuckets()
 
     @property
     def index(self):
@@ -95,6 +130,7 @@ class _TeamManagement(object):
 
     def reset_values(self):
         self.leader = None
+        self.player_levels.clear()
         team_levels.clear()
 
     def set_team_player_levels(self):
@@ -103,26 +139,28 @@ class _TeamManagement(object):
         self.level = self.leader_level
         if self.level is None:
             return
-        for player in player_dictionary.values():
-            if player.team != self.number:
-                continue
-            if player.level == self.level:
+        for userid, level in list(self.player_levels.items()):
+            if level == self.level:
                 continue
+            player = player_dictionary[userid]
             player.level = self.level
             player.multi_kill = 0
 
     def set_joining_player_level(self, player):
-        player.level = self.level if join_team_level.get_int() else 1
+        player.level = self.level if join_team_level.int_value else 1
 
     def find_team_leader(self, leveler=None, old_level=None, disconnect=False):
-        team_players = {
-            player.level: player for player in player_dictionary.values()
-            if player.team == self.number
-        }
-        if not team_players:
+        if not self.player_levels:
             self.leader = None
             return
-        self.leader = team_players[max(team_players.keys())]
+        leaders = self.player_levels.get_level_keys(
+            self.player_levels.max_level
+        )
+        userid = (
+            self.leader_userid if self.leader_userid in leaders
+            else next(iter(leaders))
+        )
+        self.leader = player_dictionary[userid]
 
         if disconnect:
             message_manager.chat_message(
@@ -171,6 +209,7 @@ def _check_team_leaders(game_event):
     userid = game_event['userid']
     old_team_number = game_event['oldteam']
 
+    teamwork_manager.remove_player(userid)
     old_team = teamwork_manager.get(old_team_number)
     if old_team and old_team.leader_userid == userid:
         old_team.find_team_leader(disconnect=True)
@@ -179,13 +218,21 @@ def _check_team_leaders(game_event):
     if not new_team:
         return
 
+    player = player_dictionary[userid]
     if not old_team_number:
-        new_team.set_joining_player_level(player_dictionary[userid])
+        new_team.set_joining_player_level(player)
+        teamwork_manager.add_player(player, new_team.number)
 
     else:
+        teamwork_manager.add_player(player, new_team.number)
         new_team.find_team_leader()
 
 
+@Event('player_disconnect')
+def _remove_disconnecting_player(game_event):
+    teamwork_manager.remove_player(game_event['userid'])
+
+
 @Event('round_start')
 def _send_level_messages(game_event):
     for team in teamwork_manager.values():
@@ -201,16 +248,19 @@ def _sync_player_levels(game_event):
 # =============================================================================
 # >> GUNGAME EVENTS
 # =============================================================================
-@Event('gg_start')
+@GGEvent('gg_start')
 @OnLevelInit
 def _clear_team_dictionary(game_event=None):
     teamwork_manager.clear()
+    teamwork_manager.add_current_players()
 
 
-@Event('gg_level_up')
+@GGEvent('gg_level_up')
 def _level_up(game_event):
     player = player_dictionary[game_event['leveler']]
-    team = teamwork_manager[player.team]
+    team = teamwork_manager.get_player_team(player.userid)
+    if team is None:
+        return
     if (
         team.leader_userid in (None, player.userid) or
         team.leader_level < game_event['new_level']
@@ -218,15 +268,15 @@ def _level_up(game_event):
         team.leader = player
 
 
-@Event('gg_level_down')
+@GGEvent('gg_level_down')
 def _check_team_decrease(game_event):
     player = player_dictionary[game_event['leveler']]
-    team = teamwork_manager[player.team]
-    if team.leader.userid == player.userid:
+    team = teamwork_manager.get_player_team(player.userid)
+    if team is not None and team.leader_userid == player.userid:
         team.find_team_leader(player, game_event['old_level'])
 
 
-@Event('gg_team_win')
+@GGEvent('gg_team_win')
 def _end_match(game_event):
     # Set the match status
     GunGameStatus.MATCH = GunGameMatchStatus.POST
@@ -260,21 +310,30 @@ def _end_match(game_event):
     winner_sound = sound_manager.play_sound('winner')
 
     # Set the dynamic chat time, if needed
-    if dynamic_chat_time.get_bool():
+    if dynamic_chat_time.bool_value:
         ConVar('mp_chattime').set_float(winner_sound.duration)
 
     # End the match to move to the next map
-    entity = Entity.find_or_create('game_end')
+    entity = entity_budget.get_helper('game_end', 'gg_teamwork')
     entity.end_game()
 
     # Reset the teams
     _clear_team_dictionary()
 
 
+# =============================================================================
+# >> ATTRIBUTE CALLBACKS
+# =============================================================================
+@AttributePostHook('level')
+def _post_level_change(player, attribute, new_value, old_value):
+    """Keep the player's level current in their team's level buckets."""
+    teamwork_manager.set_player_level(player.userid, new_value)
+
+
 # =============================================================================
 # >> EVENT HOOKS
 # =============================================================================
-@PreEvent('gg_win')
+@GGPreEvent('gg_win')
 def pre_gg_win(game_event):
     team_number = player_dictionary[game_event['winner']].team
     Delay(
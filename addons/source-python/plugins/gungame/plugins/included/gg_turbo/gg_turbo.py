@@ -20,6 +20,6 @@ def _post_level_change(player, attribute, new_value, old_value):
     """Give the player their new weapon."""
     player.strip_weapons()
     player.give_level_weapon()
-    if quick_switch.get_int():
+    if quick_switch.int_value:
         # TODO: fix this for snipers
         player.next_attack = 0